@@ -6,7 +6,8 @@ import tkinter as tk
 from tkinter import messagebox
 from openpyxl import Workbook, load_workbook
 from docx import Document
-from docx.shared import RGBColor
+from docx_renderer import add_highlighted_paragraph
+from submission_queue import writer_lock
 
 # --- File paths ---
 EXCEL_FILE = "SmartVocabularyNotes.xlsx"
@@ -58,18 +59,9 @@ def update_doc_file(sentence_no, sentence, new_words):
         doc = Document()
         doc.add_heading("Highlighted Notes", level=1)
 
-    paragraph = doc.add_paragraph()
-    paragraph.add_run(f"{sentence_no}. ")
-
-    for w in sentence.split():
-        clean_w = re.sub(r"[^\w\s]", "", w)
-        if clean_w in new_words:
-            run = paragraph.add_run(w + " ")
-            run.font.bold = True
-            run.font.highlight_color = 7  # Yellow
-            run.font.color.rgb = RGBColor(0, 0, 0)
-        else:
-            paragraph.add_run(w + " ")
+    add_highlighted_paragraph(
+        doc, sentence, lambda w: re.sub(r"[^\w\s]", "", w) in new_words, prefix=f"{sentence_no}. "
+    )
 
     doc.save(DOC_FILE)
 
@@ -79,22 +71,28 @@ def add_sentence():
     if not sentence:
         return
 
-    wb, ws = get_workbook()
-    existing_words = load_existing_words(ws)
-    new_words = extract_new_words(sentence, existing_words)
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    sentence_no = ws.max_row
-
-    if new_words:
-        for w in new_words:
-            ws.append([sentence_no, w, sentence, timestamp])
-            sentence_no += 1
-    else:
-        ws.append([sentence_no, "", sentence, timestamp])
-        sentence_no += 1
-
-    wb.save(EXCEL_FILE)
-    update_doc_file(sentence_no - 1, sentence, [w for w in new_words])
+    try:
+        # Same writer lock as main.py / bulk_ingest.py – no concurrent rewrites
+        with writer_lock():
+            wb, ws = get_workbook()
+            existing_words = load_existing_words(ws)
+            new_words = extract_new_words(sentence, existing_words)
+            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            sentence_no = ws.max_row
+
+            if new_words:
+                for w in new_words:
+                    ws.append([sentence_no, w, sentence, timestamp])
+                    sentence_no += 1
+            else:
+                ws.append([sentence_no, "", sentence, timestamp])
+                sentence_no += 1
+
+            wb.save(EXCEL_FILE)
+            update_doc_file(sentence_no - 1, sentence, [w for w in new_words])
+    except TimeoutError as e:
+        messagebox.showwarning("Busy", str(e))
+        return
 
     entry.delete(0, tk.END)
     messagebox.showinfo("Saved", f"Sentence saved. {len(new_words)} new words highlighted in DOC.")
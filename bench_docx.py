@@ -0,0 +1,91 @@
+"""
+⏱️ DOCX size / save-time benchmark
+---------------------------------
+✅ Builds the same N-paragraph notes document two ways:
+   per-token  – one run per token with explicit font properties (old word_handler)
+   coalesced  – docx_renderer.add_highlighted_paragraph
+✅ Reports document.xml size, file size, save time and reload time
+Run: python bench_docx.py [paragraphs]   (default 10000)
+"""
+
+import os, sys, tempfile, time, zipfile
+from docx import Document
+from docx.enum.text import WD_COLOR_INDEX
+from docx.shared import RGBColor, Pt
+from docx_renderer import add_highlighted_paragraph, ensure_highlight_style
+
+SENTENCES = [
+    ("She quickly realized the meeting had been postponed until further notice.", {"realized", "postponed"}),
+    ("They went to the market and bought fresh vegetables for dinner.", {"went", "bought"}),
+    ("The committee reached a unanimous decision after a long debate.", {"unanimous"}),
+    ("He was reluctant to admit that his theory was fundamentally flawed.", {"reluctant", "flawed"}),
+]
+
+
+def is_new_for(targets):
+    return lambda token: token.strip(".,?!").lower() in targets
+
+
+def build_per_token(n):
+    doc = Document()
+    doc.add_heading("Highlighted Notes", level=1)
+    for i in range(n):
+        sentence, targets = SENTENCES[i % len(SENTENCES)]
+        p = doc.add_paragraph()
+        p.add_run(f"{i + 1}. ")
+        for token in sentence.split():
+            r = p.add_run(token + " ")
+            if token.strip(".,?!").lower() in targets:
+                r.bold = True
+                r.font.highlight_color = WD_COLOR_INDEX.YELLOW
+                r.font.color.rgb = RGBColor(0, 0, 0)
+            r.font.size = Pt(12)
+    return doc
+
+
+def build_coalesced(n):
+    doc = Document()
+    doc.add_heading("Highlighted Notes", level=1)
+    doc.styles["Normal"].font.size = Pt(12)
+    style = ensure_highlight_style(doc)
+    for i in range(n):
+        sentence, targets = SENTENCES[i % len(SENTENCES)]
+        add_highlighted_paragraph(doc, sentence, is_new_for(targets), prefix=f"{i + 1}. ", style=style)
+    return doc
+
+
+def measure(name, build, n, folder):
+    path = os.path.join(folder, f"{name}.docx")
+    start = time.perf_counter()
+    doc = build(n)
+    built = time.perf_counter() - start
+
+    start = time.perf_counter()
+    doc.save(path)
+    saved = time.perf_counter() - start
+
+    start = time.perf_counter()
+    Document(path)
+    loaded = time.perf_counter() - start
+
+    with zipfile.ZipFile(path) as z:
+        xml_size = z.getinfo("word/document.xml").file_size
+    return name, built, saved, loaded, xml_size, os.path.getsize(path)
+
+
+def run(n=10000):
+    with tempfile.TemporaryDirectory() as folder:
+        rows = [measure("per-token", build_per_token, n, folder),
+                measure("coalesced", build_coalesced, n, folder)]
+
+    print(f"\n{n:,} paragraphs")
+    print(f"{'renderer':<10} {'build (s)':>10} {'save (s)':>9} {'load (s)':>9} {'document.xml':>14} {'.docx':>10}")
+    for name, built, saved, loaded, xml_size, file_size in rows:
+        print(f"{name:<10} {built:>10.2f} {saved:>9.2f} {loaded:>9.2f} {xml_size / 1024:>11,.0f} KB {file_size / 1024:>7,.0f} KB")
+    before, after = rows
+    print(f"\ndocument.xml {before[4] / after[4]:.1f}x smaller, save {before[2] / after[2]:.1f}x faster")
+    return rows
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
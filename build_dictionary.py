@@ -0,0 +1,97 @@
+"""
+🏗️ Build the compiled dictionary
+--------------------------------
+✅ Compiles only what get_explanation() needs from WordNet:
+   POS set, first definition per POS, noun plural, morphy exception lists
+✅ Writes one sorted, binary-searchable file (see lexicon.py for the reader)
+✅ Run once before PyInstaller: python build_dictionary.py
+   The app then never imports NLTK.
+
+File layout (little-endian):
+    b"LBDICT01" | uint32 count | uint32 offset[count] | records...
+    record = key \t pos \t plural \t def_n \t def_v \t def_a \t def_r
+                 \t exc_n \t exc_v \t exc_a \t exc_r \n
+Records are sorted by the UTF-8 bytes of key; exc_* are space-separated
+bases from WordNet's exception lists (e.g. "went" → exc_v "go").
+"""
+
+import os, struct, sys
+os.environ["TYPEGUARD_DISABLE"] = "1"
+
+import inflect
+import nltk
+from nltk.corpus import wordnet
+from config import DICTIONARY_FILE
+
+MAGIC = b"LBDICT01"
+POS_ORDER = "nvar"   # same order wordnet.synsets() walks NOUN, VERB, ADJ, ADV
+
+
+def _clean(text: str) -> str:
+    """Keep fields free of the record separators."""
+    return " ".join(text.replace("\t", " ").split())
+
+
+def _usable(key: str) -> bool:
+    # The app only ever looks up single words made of letters and apostrophes
+    return bool(key) and "_" not in key and " " not in key
+
+
+def collect_records():
+    """Return {key: [pos, plural, def_n, def_v, def_a, def_r, exc_n, exc_v, exc_a, exc_r]}."""
+    nltk.download("wordnet", quiet=True)
+    p = inflect.engine()
+    wordnet.ensure_loaded()
+    records = {}
+
+    def record(key):
+        return records.setdefault(key, [""] * 10)
+
+    for lemma, by_pos in wordnet._lemma_pos_offset_map.items():
+        if not _usable(lemma):
+            continue
+        fields = None
+        for i, pos in enumerate(POS_ORDER):
+            offsets = by_pos.get(pos)
+            if not offsets:
+                continue
+            fields = fields or record(lemma)
+            fields[0] += pos
+            fields[2 + i] = _clean(wordnet.synset_from_pos_and_offset(pos, offsets[0]).definition())
+        if fields and "n" in fields[0]:
+            plural = p.plural(lemma)
+            fields[1] = plural if plural and plural != lemma else ""
+
+    for i, pos in enumerate(POS_ORDER):
+        for form, bases in wordnet._exception_map[pos].items():
+            if _usable(form):
+                record(form)[6 + i] = " ".join(bases)
+
+    return records
+
+
+def write_dictionary(records, path=DICTIONARY_FILE):
+    """Serialize records sorted by key with an offset index in front."""
+    blobs = [
+        ("\t".join([key] + fields) + "\n").encode("utf-8")
+        for key, fields in sorted(records.items(), key=lambda kv: kv[0].encode("utf-8"))
+    ]
+    header = len(MAGIC) + 4 + 4 * len(blobs)
+    offsets, pos = [], header
+    for blob in blobs:
+        offsets.append(pos)
+        pos += len(blob)
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(blobs)))
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp, path)
+    print(f"💾 Wrote {len(blobs)} entries ({pos / 1024 / 1024:.1f} MB) to {path}")
+
+
+if __name__ == "__main__":
+    write_dictionary(collect_records(), sys.argv[1] if len(sys.argv) > 1 else DICTIONARY_FILE)
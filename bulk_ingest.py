@@ -0,0 +1,42 @@
+"""
+📥 Bulk ingest
+-------------
+✅ Queues every non-empty line of a text file as a sentence
+✅ Safe while the GUI is open – the current writer picks them up in batches
+Run: python bulk_ingest.py sentences.txt [--apply]
+     --apply  become the writer now if nobody else is (otherwise the GUI will)
+"""
+
+import sys
+from submission_queue import enqueue
+
+
+def ingest(path, apply=False):
+    with open(path, "r", encoding="utf-8") as f:
+        ids = [enqueue(line.strip(), source="bulk") for line in f if line.strip()]
+    print(f"📬 Queued {len(ids)} sentences from {path}")
+
+    if apply:
+        from lingo_core import apply_pending
+        try:
+            results = apply_pending()
+        except OSError as e:
+            print(f"⚠️ Could not write the notebook ({e}) – sentences stay queued.")
+            return ids
+        if results is None:
+            print("⏳ Another LingoBaby process is writing – it will apply the queue.")
+        else:
+            failed = [sub_id for sub_id, words in results.items() if isinstance(words, Exception)]
+            added = sum(len(words) for words in results.values() if not isinstance(words, Exception))
+            print(f"✅ Applied {len(results) - len(failed)} sentences, {added} new words.")
+            if failed:
+                print(f"⚠️ {len(failed)} sentences set aside as .failed in the queue folder.")
+    return ids
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if a != "--apply"]
+    if len(args) != 1:
+        print("Usage: python bulk_ingest.py sentences.txt [--apply]")
+        sys.exit(1)
+    ingest(args[0], apply="--apply" in sys.argv)
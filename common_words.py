@@ -0,0 +1,36 @@
+"""
+🚦 Common-word filter
+--------------------
+✅ Bundled frequency list (common_words.txt, most frequent first – ranked by
+   wordfreq's English data, see the file header for source and license)
+✅ The top-N words for the learner's level are loaded once into a frozenset
+✅ Checked before any lemmatizer / dictionary work, so "the", "is", "have"
+   never cost a WordNet lookup or a notebook row
+"""
+
+from config import COMMON_WORDS_FILE, COMMON_WORD_LEVELS, LEARNER_LEVEL
+from helpers import resource_path
+
+
+def load_common_words(level=LEARNER_LEVEL, path=None):
+    """Return the `level`'s top-N most frequent words as a frozenset."""
+    limit = COMMON_WORD_LEVELS.get(level)
+    if limit is None:
+        print(f"⚠️ Unknown learner level '{level}' (choose from: {', '.join(COMMON_WORD_LEVELS)})")
+        return frozenset()
+    if not limit:
+        return frozenset()
+
+    path = path or resource_path(COMMON_WORDS_FILE)
+    words = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                w = line.strip().lower()
+                if w and not w.startswith("#"):
+                    words.append(w)
+                    if len(words) >= limit:
+                        break
+    except Exception as e:
+        print(f"⚠️ Failed to read common words list: {e}")
+    return frozenset(words)
@@ -0,0 +1,150 @@
+"""
+🔎 Sentence concordance
+----------------------
+✅ Inverted index: base form → every saved sentence that uses it (any inflection)
+✅ Grows by one append per submit – the workbook is never rescanned
+✅ Queries are a dict lookup; snippets highlight the matching forms
+Stored as JSON lines (one sentence per line, with the base form of each token),
+so loading needs no lemmatization at all. Lines appended by other processes are
+tail-read before each query, the same way notes_store.py does it.
+"""
+
+import json, os, re
+
+TOKEN_RE = re.compile(r"\b[a-zA-Z']+\b")
+MARK_OPEN, MARK_CLOSE = "«", "»"
+
+
+class ConcordanceIndex:
+    def __init__(self, path, get_base_form):
+        self.path = path
+        self._base_form = get_base_form
+        self._reset()
+        self._refresh()
+
+    def _reset(self):
+        self.sentences = []     # id -> (sentence, [base per token])
+        self.postings = {}      # base -> [sentence ids]
+        self._offset = 0        # bytes of the file already indexed
+        self._stat = None       # (size, mtime_ns) when last synced
+
+    # -----------------------------
+    # 💾 Storage
+    # -----------------------------
+    def _refresh(self):
+        """Index only the lines other processes appended since the last sync."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        if (st.st_size, st.st_mtime_ns) == self._stat:
+            return
+        if st.st_size < self._offset:
+            self._reset()   # truncated or replaced – start over
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self._offset)
+                data = f.read()
+            complete = data.rfind(b"\n") + 1   # a line still being written is picked up next time
+            for line in data[:complete].splitlines():
+                if line.strip():
+                    entry = json.loads(line)
+                    self._index(entry["sentence"], entry["bases"])
+            self._offset += complete
+            self._stat = (st.st_size, st.st_mtime_ns)
+        except Exception as e:
+            print(f"⚠️ Failed to read concordance index: {e}")
+
+    def _index(self, sentence, bases):
+        sid = len(self.sentences)
+        self.sentences.append((sentence, bases))
+        for base in set(bases):
+            self.postings.setdefault(base, []).append(sid)
+
+    def _line(self, sentence, timestamp):
+        bases = [self._base_form(t).lower() for t in TOKEN_RE.findall(sentence)]
+        entry = {"sentence": sentence, "bases": bases, "time": timestamp}
+        return bases, (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+
+    def add(self, sentence, timestamp=""):
+        """Index one saved sentence and append it to the index file."""
+        self._refresh()
+        bases, line = self._line(sentence, timestamp)
+        try:
+            with open(self.path, "ab") as f:
+                start = f.tell()
+                f.write(line)
+        except Exception as e:
+            print(f"⚠️ Failed to save concordance entry: {e}")
+            self._index(sentence, bases)
+            return
+        if start == self._offset:
+            self._index(sentence, bases)
+            self._offset += len(line)
+            st = os.stat(self.path)
+            self._stat = (st.st_size, st.st_mtime_ns)
+        else:
+            self._refresh()   # someone else appended in between
+
+    def bootstrap(self, saved):
+        """
+        One-time build for notebooks older than the index: `saved` yields
+        (sentence, timestamp) pairs. Does nothing once the index file exists.
+        """
+        if os.path.exists(self.path):
+            return
+        tmp = self.path + ".tmp"
+        count = 0
+        with open(tmp, "wb") as f:
+            for sentence, timestamp in saved:
+                f.write(self._line(sentence, timestamp)[1])
+                count += 1
+        os.replace(tmp, self.path)
+        self._reset()
+        self._refresh()
+        if count:
+            print(f"🔎 Indexed {count} previously saved sentences")
+
+    # -----------------------------
+    # 🔍 Queries
+    # -----------------------------
+    def search(self, query, limit=None):
+        """
+        Sentences using any form of the word(s) in `query` ("went", "go/went/gone").
+        Returns [(sentence, snippet)] oldest first.
+        """
+        self._refresh()
+        targets, ids = self._lookup(query)
+        if limit is not None:
+            ids = ids[:limit]
+        return [(self.sentences[sid][0], self.snippet(sid, targets)) for sid in ids]
+
+    def count(self, query):
+        """Number of sentences `search(query)` would return."""
+        self._refresh()
+        return len(self._lookup(query)[1])
+
+    def _lookup(self, query):
+        targets = {self._base_form(t).lower() for t in TOKEN_RE.findall(query)}
+        return targets, sorted({sid for base in targets for sid in self.postings.get(base, ())})
+
+    def snippet(self, sid, targets, width=90):
+        """Sentence trimmed to `width` around the first hit, matching tokens wrapped in «»."""
+        sentence, bases = self.sentences[sid]
+        spans = [m.span() for m, base in zip(TOKEN_RE.finditer(sentence), bases) if base in targets]
+        if not spans:
+            return sentence
+
+        # Clip the raw sentence first so a «» pair is never cut in half
+        lo, hi = 0, len(sentence)
+        if len(sentence) > width:
+            lo = max(0, min(spans[0][0] - width // 3, len(sentence) - width))
+            hi = lo + width
+
+        out, pos = [], lo
+        for start, end in spans:
+            if start >= lo and end <= hi:
+                out += [sentence[pos:start], MARK_OPEN, sentence[start:end], MARK_CLOSE]
+                pos = end
+        out.append(sentence[pos:hi])
+        return ("…" if lo else "") + "".join(out) + ("…" if hi < len(sentence) else "")
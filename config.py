@@ -4,3 +4,23 @@ DOC_FILE = "HighlightedNotes.docx"
 SHEET_NAME = "New Words"
 ICON_FILE = "icon.ico"   # optional icon file (place in same folder)
 TEMP_EXCEL = "._temp_smart_vocab.xlsx"
+IRREGULAR_JSON = "irregular_verbs_extended.json"
+LEMMA_TABLE_FILE = "lemma_table.json"
+LEMMATIZER_BACKEND = "suffix"   # suffix | wordnet | normalize | table (compare with lemma_bench.py)
+DICTIONARY_FILE = "lingo_dictionary.bin"   # built by build_dictionary.py, bundled by main.spec
+PREVIEW_DELAY_MS = 250   # debounce for the live new-word preview
+CONCORDANCE_FILE = "concordance_index.jsonl"   # sentence index, appended on every submit
+SEARCH_SNIPPETS = 8   # sentences shown per search
+QUEUE_DIR = "submissions"          # sentences waiting for the single writer
+LOCK_FILE = ".lingobaby.lock"      # advisory writer lock shared by all front-ends
+LOCK_STALE_SECONDS = 120           # a lock older than this was left by a crashed writer
+QUEUE_BATCH = 200                  # max sentences applied per save
+QUEUE_POLL_MS = 5000               # how often the GUI applies sentences queued by others
+LAZY_OFFICE_VIEWS = False          # True: keep notes in NOTES_STORE_FILE, rebuild Excel/Doc only on view/exit/timer
+NOTES_STORE_FILE = "notes_store.jsonl"
+NOTES_STATE_FILE = "notes_store_state.json"
+MATERIALIZE_INTERVAL_MS = 300000   # lazy mode: refresh dirty Office views every 5 minutes
+COMMON_WORDS_FILE = "common_words.txt"   # bundled frequency list, most frequent first
+COMMON_WORD_LEVELS = {"off": 0, "beginner": 100, "intermediate": 400, "advanced": 900}   # top-N words treated as known
+LEARNER_LEVEL = "beginner"
+SESSION_LOG = ""   # path to record submit/search/explain calls for replay.py ("" = off)
@@ -2,19 +2,13 @@
 import os
 os.environ["TYPEGUARD_DISABLE"] = "1"  # 👈 Disable typeguard for PyInstaller build
 
-import inflect
-from nltk.corpus import wordnet
-import nltk
-
-nltk.download('wordnet', quiet=True)
-
-p = inflect.engine()
+import lexicon
 
 def get_explanation(word: str) -> str:
     word = word.lower().strip()
     explanation_parts = []
 
-    plural = p.plural(word)
+    plural = lexicon.plural(word)
     if plural and plural != word:
         explanation_parts.append(f"Plural: {plural}")
 
@@ -24,8 +18,8 @@ def get_explanation(word: str) -> str:
     third_form = word if word.endswith("s") else word + "s"
     explanation_parts.append(f"Verb forms: {word}, {ing_form}, {past_form}, {third_form}")
 
-    synsets = wordnet.synsets(word)
-    if synsets:
-        explanation_parts.append(f"Meaning: {synsets[0].definition()}")
+    _, meaning = lexicon.synsets_summary(word)
+    if meaning:
+        explanation_parts.append(f"Meaning: {meaning}")
 
     return " | ".join(explanation_parts)
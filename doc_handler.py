@@ -1,7 +1,7 @@
 # doc_handler.py
 import os
 from docx import Document
-from docx.enum.text import WD_COLOR_INDEX
+from docx_renderer import add_highlighted_paragraph
 
 DOC_FILE = "HighlightedNotes.docx"
 
@@ -16,13 +16,7 @@ def init_doc():
 
 def add_sentence_to_doc(sentence, new_words):
     doc = init_doc()
-    para = doc.add_paragraph()
-    words = sentence.split()
-
-    for w in words:
-        run = para.add_run(w + " ")
-        if w.lower().strip(".,?!") in [nw.lower() for nw in new_words]:
-            run.font.highlight_color = WD_COLOR_INDEX.YELLOW
-            run.bold = True
+    targets = {nw.lower() for nw in new_words}
+    add_highlighted_paragraph(doc, sentence, lambda w: w.lower().strip(".,?!") in targets)
 
     doc.save(DOC_FILE)
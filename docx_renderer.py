@@ -0,0 +1,68 @@
+"""
+🖍️ DOCX sentence renderer
+------------------------
+✅ One run per stretch of same-looking text instead of one run per token
+✅ Highlighted words use a shared "New Word" character style
+   (bold + yellow + black) rather than repeating font properties per run
+Used by every writer of HighlightedNotes.docx; see bench_docx.py for sizes.
+"""
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_COLOR_INDEX
+from docx.shared import RGBColor
+
+HIGHLIGHT_STYLE = "New Word"
+
+
+def ensure_highlight_style(doc):
+    """Return the shared highlight character style, creating it once per document."""
+    try:
+        return doc.styles[HIGHLIGHT_STYLE]
+    except KeyError:
+        style = doc.styles.add_style(HIGHLIGHT_STYLE, WD_STYLE_TYPE.CHARACTER)
+        style.font.bold = True
+        style.font.highlight_color = WD_COLOR_INDEX.YELLOW
+        style.font.color.rgb = RGBColor(0, 0, 0)
+        return style
+
+
+def _add_styled_run(paragraph, text, style_id):
+    # Set w:rStyle directly – run.style = style re-resolves the style
+    # against the whole styles part on every call
+    run = paragraph.add_run(text)
+    run._r.style = style_id
+    return run
+
+
+def add_highlighted_paragraph(doc, sentence, is_new, prefix="", bold_prefix=False, style=None):
+    """
+    Append `sentence` as one paragraph, highlighting tokens where is_new(token).
+    Consecutive tokens with the same look are merged into a single run; a plain
+    prefix (e.g. "3. ") is merged into the first plain run.
+    """
+    if style is None:
+        style = ensure_highlight_style(doc)
+    style_id = style.style_id
+    p = doc.add_paragraph()
+    plain, highlighted = prefix, ""
+    if prefix and bold_prefix:
+        p.add_run(prefix).bold = True
+        plain = ""
+
+    for token in sentence.split():
+        if is_new(token):
+            if plain:
+                p.add_run(plain)
+                plain = ""
+            highlighted += token + " "
+        else:
+            if highlighted:
+                _add_styled_run(p, highlighted, style_id)
+                highlighted = ""
+            plain += token + " "
+
+    if plain:
+        p.add_run(plain)
+    if highlighted:
+        _add_styled_run(p, highlighted, style_id)
+    return p
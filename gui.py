@@ -3,6 +3,7 @@ import tkinter as tk
 from tkinter import messagebox
 from excel_handler import add_new_sentence
 from doc_handler import add_sentence_to_doc
+from submission_queue import writer_lock
 
 def extract_new_words(sentence, existing_words):
     import re
@@ -27,14 +28,20 @@ def on_submit():
         root.destroy()
         return
 
-    existing_words = get_existing_words()
-    new_words = extract_new_words(sentence, existing_words)
+    try:
+        with writer_lock():
+            existing_words = get_existing_words()
+            new_words = extract_new_words(sentence, existing_words)
+            if new_words:
+                add_new_sentence(new_words, sentence)
+                add_sentence_to_doc(sentence, new_words)
+    except TimeoutError as e:
+        messagebox.showwarning("Busy", str(e))
+        return
 
     if not new_words:
         messagebox.showinfo("Info", "No new words found.")
     else:
-        add_new_sentence(new_words, sentence)
-        add_sentence_to_doc(sentence, new_words)
         messagebox.showinfo("Success", f"Added: {', '.join(new_words)}")
 
     entry.delete(0, tk.END)
@@ -1,6 +1,5 @@
 # helpers.py
 import re
-import subprocess
 import os
 from config import ICON_FILE
 
@@ -15,21 +14,6 @@ def clean_word_for_compare(word: str) -> str:
     word = re.sub(r"[^\w\s]", "", word)
     return word.strip().lower()
 
-def close_excel_if_open():
-    """Close Excel on Windows using taskkill (safe ignore errors)."""
-    try:
-        # Kill all excel instances so file locks are released
-        subprocess.call(["taskkill", "/f", "/im", "EXCEL.EXE"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-    except Exception:
-        pass
-
-def close_word_if_open():
-    """Close Word on Windows using taskkill (safe ignore errors)."""
-    try:
-        subprocess.call(["taskkill", "/f", "/im", "WINWORD.EXE"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-    except Exception:
-        pass
-
 def set_window_icon(root):
     """Set tkinter window icon from ICON_FILE if exists."""
     from config import ICON_FILE
@@ -39,3 +23,9 @@ def set_window_icon(root):
         except Exception:
             # Some systems may not support ico or icon may be invalid
             pass
+
+def resource_path(name):
+    """Path to a bundled data file (works inside a PyInstaller onefile too)."""
+    import sys
+    base = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base, name)
@@ -0,0 +1,112 @@
+"""
+⏱️ Lemmatizer harness
+--------------------
+✅ Per-token throughput of every backend in lemmatizers.py, cold (empty
+   lexicon cache) and warm (repeated passes over the same words)
+✅ Pairwise agreement on a fixed word list
+✅ Accuracy against the expected base forms of that list
+   (the table backend is scored as shipped: lemma_table.json, or the same
+    table built from the compiled dictionary when the file is missing)
+Run: python lemma_bench.py [repeats]
+"""
+
+import os, sys, time
+import lexicon
+from config import LEMMA_TABLE_FILE
+from lemmatizers import BACKENDS, get_lemmatizer, load_irregulars
+from lemmatizers import compute_lemma_table, dictionary_forms, make_table_lemmatizer
+
+# (form, expected base) – mix of plain words, regular and irregular inflections
+GOLD = [
+    ("go", "go"), ("goes", "go"), ("went", "go"), ("gone", "go"), ("going", "go"),
+    ("be", "be"), ("is", "be"), ("was", "be"), ("were", "be"), ("been", "be"),
+    ("have", "have"), ("has", "have"), ("had", "have"), ("having", "have"),
+    ("do", "do"), ("does", "do"), ("did", "do"), ("done", "do"),
+    ("see", "see"), ("saw", "see"), ("seen", "see"), ("sees", "see"),
+    ("take", "take"), ("took", "take"), ("taken", "take"), ("takes", "take"),
+    ("run", "run"), ("ran", "run"), ("running", "run"), ("runs", "run"),
+    ("sing", "sing"), ("sang", "sing"), ("sung", "sing"), ("singing", "sing"),
+    ("fight", "fight"), ("fought", "fight"), ("fighting", "fight"),
+    ("write", "write"), ("wrote", "write"), ("written", "write"),
+    ("speak", "speak"), ("spoke", "speak"), ("spoken", "speak"),
+    ("buy", "buy"), ("bought", "buy"), ("think", "think"), ("thought", "think"),
+    ("play", "play"), ("played", "play"), ("playing", "play"), ("plays", "play"),
+    ("walk", "walk"), ("walked", "walk"), ("walking", "walk"), ("walks", "walk"),
+    ("jump", "jump"), ("jumped", "jump"), ("jumps", "jump"),
+    ("cry", "cry"), ("cried", "cry"), ("cries", "cry"),
+    ("stop", "stop"), ("stopped", "stop"), ("stopping", "stop"),
+    ("make", "make"), ("made", "make"), ("making", "make"),
+    ("learn", "learn"), ("learned", "learn"), ("learning", "learn"),
+    ("watch", "watch"), ("watches", "watch"), ("watched", "watch"),
+    ("fix", "fix"), ("fixes", "fix"), ("fixed", "fix"),
+    ("book", "book"), ("books", "book"), ("cat", "cat"), ("cats", "cat"),
+    ("box", "box"), ("boxes", "box"), ("church", "church"), ("churches", "church"),
+    ("city", "city"), ("cities", "city"), ("baby", "baby"), ("babies", "baby"),
+    ("word", "word"), ("words", "word"), ("sentence", "sentence"), ("sentences", "sentence"),
+    ("idea", "idea"), ("ideas", "idea"), ("teacher", "teacher"), ("teachers", "teacher"),
+    ("happy", "happy"), ("quickly", "quickly"), ("beautiful", "beautiful"),
+    ("the", "the"), ("a", "a"), ("of", "of"), ("and", "and"), ("in", "in"),
+    ("this", "this"), ("always", "always"), ("bus", "bus"), ("news", "news"),
+    ("glass", "glass"), ("series", "series"), ("thing", "thing"), ("morning", "morning"),
+    ("bed", "bed"), ("red", "red"), ("need", "need"), ("needed", "need"),
+]
+WORD_LIST = [form for form, _ in GOLD]
+
+
+def time_backend(lemmatize, words, repeats):
+    """Return seconds per token over `repeats` passes of `words` (warm caches)."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for w in words:
+            lemmatize(w)
+    return (time.perf_counter() - start) / (repeats * len(words))
+
+
+def agreement(a, b):
+    """Fraction of positions where two result lists match."""
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+def run(repeats=200):
+    irregular_verbs, irregular_map = load_irregulars()
+    results, rows = {}, []
+
+    for name in BACKENDS:
+        try:
+            start = time.perf_counter()
+            if name == "table" and not os.path.exists(LEMMA_TABLE_FILE):
+                print(f"(table: {LEMMA_TABLE_FILE} missing – building it in memory from the dictionary)")
+                table = compute_lemma_table(dictionary_forms())
+                start = time.perf_counter()
+                lemmatize = make_table_lemmatizer(irregular_verbs, irregular_map, table=table)
+            else:
+                lemmatize = get_lemmatizer(name, irregular_verbs, irregular_map)
+            setup = time.perf_counter() - start
+            # Cold pass: nothing cached yet, like the first sentences of a session
+            lexicon._record.cache_clear()
+            start = time.perf_counter()
+            out = [lemmatize(w) for w in WORD_LIST]
+            cold = (time.perf_counter() - start) / len(WORD_LIST)
+        except Exception as e:
+            print(f"⚠️ Skipped backend '{name}': {e}")
+            continue
+        warm = time_backend(lemmatize, WORD_LIST, repeats)
+        accuracy = agreement(out, [base for _, base in GOLD])
+        results[name] = out
+        rows.append((name, setup, cold, warm, accuracy))
+
+    print(f"\n{'backend':<10} {'setup (s)':>10} {'cold µs/tok':>12} {'warm µs/tok':>12} {'warm tok/s':>12} {'accuracy':>9}")
+    for name, setup, cold, warm, accuracy in sorted(rows, key=lambda r: r[2]):
+        print(f"{name:<10} {setup:>10.3f} {cold * 1e6:>12.2f} {warm * 1e6:>12.2f} {1 / warm:>12,.0f} {accuracy:>8.1%}")
+
+    names = list(results)
+    print("\nAgreement on", len(WORD_LIST), "words:")
+    print(" " * 10 + "".join(f"{n:>10}" for n in names))
+    for a in names:
+        print(f"{a:<10}" + "".join(f"{agreement(results[a], results[b]):>10.1%}" for b in names))
+
+    return results
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
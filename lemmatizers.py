@@ -0,0 +1,196 @@
+"""
+🔤 Lemmatizer backends
+----------------------
+✅ One interface for every "word → base form" strategy in the app
+✅ suffix     – suffix stripping + WordNet check (main.py's original get_base_form)
+✅ wordnet    – WordNetLemmatizer verb lemma (update_if_irregular_v2.lemma)
+✅ normalize  – lowercase / strip punctuation only (helpers.clean_word_for_compare)
+✅ table      – precomputed JSON table lookup, built offline from another backend
+                over every form in the compiled dictionary
+Pick one with LEMMATIZER_BACKEND in config.py; compare them with lemma_bench.py.
+"""
+
+import os, json, sys
+from config import IRREGULAR_JSON, LEMMA_TABLE_FILE, LEMMATIZER_BACKEND
+from helpers import clean_word_for_compare
+import lexicon
+
+
+# -----------------------------
+# 🧩 Irregular Verbs Loader
+# -----------------------------
+def load_irregulars(path=IRREGULAR_JSON):
+    """Load irregular verbs from JSON file once."""
+    if not os.path.exists(path):
+        print(f"⚠️ JSON not found: {path}")
+        return {}, {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        verbs = {v["base"].lower(): [v["past"], v["past_participle"], v["ing"], v["s"]] for v in data}
+        mapping = {form.lower(): base.lower() for base, forms in verbs.items() for form in forms}
+        return verbs, mapping
+    except Exception as e:
+        print(f"⚠️ Failed to read irregular verbs JSON: {e}")
+        return {}, {}
+
+
+# -----------------------------
+# ⚙️ Backends
+# -----------------------------
+# Every factory takes (irregular_verbs, irregular_map) and returns a
+# callable word -> base form, so backends are interchangeable.
+
+def make_suffix_lemmatizer(irregular_verbs, irregular_map):
+    """Irregular map first, then strip ing/ed/es/s if WordNet knows the stem."""
+    def lemmatize(word: str) -> str:
+        w = word.lower().strip()
+        if w in irregular_verbs:
+            return w
+        if w in irregular_map:
+            return irregular_map[w]
+        for suf in ["ing", "ed", "es", "s"]:
+            if w.endswith(suf) and len(w) > len(suf) + 1:
+                base = w[:-len(suf)]
+                if lexicon.has_synsets(base):
+                    return base
+        return w
+
+    return lemmatize
+
+
+def make_wordnet_lemmatizer(irregular_verbs, irregular_map):
+    """WordNetLemmatizer as a verb (WordNet has its own irregular lists)."""
+    def lemmatize(word: str) -> str:
+        return lexicon.lemmatize_verb(word.strip())
+
+    return lemmatize
+
+
+def make_normalize_lemmatizer(irregular_verbs, irregular_map):
+    """No lemmatization at all – just the comparison normalization."""
+    return clean_word_for_compare
+
+
+def make_table_lemmatizer(irregular_verbs, irregular_map, path=LEMMA_TABLE_FILE, table=None):
+    """Dictionary lookup in a precomputed table; unknown words are normalized."""
+    table = dict(load_lemma_table(path) if table is None else table)
+    # Irregular JSON may have grown since the table was built
+    for form, base in irregular_map.items():
+        table.setdefault(form, base)
+    for base in irregular_verbs:
+        table.setdefault(base, base)
+
+    def lemmatize(word: str) -> str:
+        w = word.lower().strip()
+        return table.get(w) or clean_word_for_compare(w)
+
+    return lemmatize
+
+
+BACKENDS = {
+    "suffix": make_suffix_lemmatizer,
+    "wordnet": make_wordnet_lemmatizer,
+    "normalize": make_normalize_lemmatizer,
+    "table": make_table_lemmatizer,
+}
+
+
+def get_lemmatizer(name=LEMMATIZER_BACKEND, irregular_verbs=None, irregular_map=None):
+    """Return the word -> base form callable for backend `name`."""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown lemmatizer backend '{name}' (choose from: {', '.join(BACKENDS)})")
+    if irregular_verbs is None or irregular_map is None:
+        irregular_verbs, irregular_map = load_irregulars()
+    return BACKENDS[name](irregular_verbs, irregular_map)
+
+
+# -----------------------------
+# 💾 Precomputed Table
+# -----------------------------
+def load_lemma_table(path=LEMMA_TABLE_FILE):
+    """Load {form: base} table; empty if missing or unreadable."""
+    if not os.path.exists(path):
+        print(f"⚠️ Lemma table not found: {path}")
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️ Failed to read lemma table: {e}")
+        return {}
+
+
+def _verb_inflections(verb):
+    """Regular -s / -ed / -ing spellings (irregular ones come from the exception lists)."""
+    if verb.endswith(("s", "x", "z", "ch", "sh")):
+        third = verb + "es"
+    elif len(verb) > 1 and verb.endswith("y") and verb[-2] not in "aeiou":
+        third = verb[:-1] + "ies"
+    else:
+        third = verb + "s"
+    if verb.endswith("e"):
+        past = verb + "d"
+    elif len(verb) > 1 and verb.endswith("y") and verb[-2] not in "aeiou":
+        past = verb[:-1] + "ied"
+    else:
+        past = verb + "ed"
+    if verb.endswith("ie"):
+        ing = verb[:-2] + "ying"
+    elif verb.endswith("e") and not verb.endswith("ee") and len(verb) > 2:
+        ing = verb[:-1] + "ing"
+    else:
+        ing = verb + "ing"
+    return third, past, ing
+
+
+def dictionary_forms():
+    """Every headword and exception form in the compiled dictionary, plus noun
+    plurals and regular verb inflections – the vocabulary the table covers."""
+    forms = set()
+    for key, pos, plural in lexicon.iter_entries():
+        forms.add(key)
+        if plural:
+            forms.add(plural)
+        if "v" in pos:
+            forms.update(_verb_inflections(key))
+    if not forms:
+        print("⚠️ Compiled dictionary not found – run build_dictionary.py first")
+    return forms
+
+
+def compute_lemma_table(words, source="suffix"):
+    """Run backend `source` over `words`; return {form: base}."""
+    irregular_verbs, irregular_map = load_irregulars()
+    lemmatize = get_lemmatizer(source, irregular_verbs, irregular_map)
+    forms = {w.lower().strip() for w in words if w.strip()}
+    forms.update(irregular_map)
+    forms.update(irregular_verbs)
+    table = {}
+    for w in sorted(forms):
+        base = lemmatize(w)
+        # Unchanged words fall back to normalization anyway – keep the table small
+        if base != clean_word_for_compare(w):
+            table[w] = base
+    return table
+
+
+def build_lemma_table(words=None, source="suffix", path=LEMMA_TABLE_FILE):
+    """Save compute_lemma_table() over `words` (default: dictionary_forms())."""
+    table = compute_lemma_table(dictionary_forms() if words is None else words, source)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(table, f, ensure_ascii=False, separators=(",", ":"))
+    print(f"💾 Saved {len(table)} entries from '{source}' to {path}")
+    return table
+
+
+# -----------------------------
+# 🚀 Build table: python lemmatizers.py [source] [wordlist.txt]
+#    (default word list: every form in the compiled dictionary)
+# -----------------------------
+if __name__ == "__main__":
+    word_list = None
+    if len(sys.argv) > 2:
+        with open(sys.argv[2], "r", encoding="utf-8") as f:
+            word_list = f.read().split()
+    build_lemma_table(word_list, sys.argv[1] if len(sys.argv) > 1 else "suffix")
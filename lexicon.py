@@ -0,0 +1,199 @@
+"""
+📖 Lexicon – WordNet lookups without loading WordNet
+----------------------------------------------------
+✅ Reads the compiled dictionary from build_dictionary.py via mmap
+✅ O(log n) binary search per lookup, nothing parsed up front, no NLTK import
+✅ Re-implements WordNet's morphy (single-pass rules, as in NLTK 3.10) so inflected
+   input ("cities", "went") resolves like wordnet.synsets() / WordNetLemmatizer
+✅ Falls back to NLTK if the compiled file is missing (dev checkouts)
+"""
+
+import mmap, os, struct, threading
+from functools import lru_cache
+from config import DICTIONARY_FILE
+from helpers import resource_path
+
+MAGIC = b"LBDICT01"
+POS_ORDER = "nvar"
+
+# Same rules as nltk.corpus.reader.wordnet.WordNetCorpusReader.MORPHOLOGICAL_SUBSTITUTIONS
+MORPHOLOGICAL_SUBSTITUTIONS = {
+    "n": [("s", ""), ("ses", "s"), ("ves", "f"), ("xes", "x"), ("zes", "z"),
+          ("ches", "ch"), ("shes", "sh"), ("men", "man"), ("ies", "y")],
+    "v": [("s", ""), ("ies", "y"), ("es", "e"), ("es", ""),
+          ("ed", "e"), ("ed", ""), ("ing", "e"), ("ing", "")],
+    "a": [("er", ""), ("est", ""), ("er", "e"), ("est", "e")],
+    "r": [],
+}
+
+_lock = threading.Lock()
+_mm = None          # mmap of the compiled file, or False when it is missing
+_count = 0
+_wordnet = None     # NLTK fallback, loaded on first use only
+_inflect = None
+
+
+# -----------------------------
+# 💾 Compiled File Access
+# -----------------------------
+def _open():
+    """Map the compiled dictionary once; return the mmap or None."""
+    global _mm, _count
+    if _mm is None:
+        with _lock:
+            if _mm is None:
+                path = resource_path(DICTIONARY_FILE)
+                if not os.path.exists(path):
+                    print(f"⚠️ Compiled dictionary not found: {path} (using NLTK)")
+                    _mm = False
+                else:
+                    with open(path, "rb") as f:
+                        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    if mm[:len(MAGIC)] != MAGIC:
+                        print(f"⚠️ Not a LingoBaby dictionary: {path} (using NLTK)")
+                        mm.close()
+                        _mm = False
+                    else:
+                        _count = struct.unpack_from("<I", mm, len(MAGIC))[0]
+                        _mm = mm
+    return _mm or None
+
+
+def available() -> bool:
+    """True when lookups are served from the compiled file."""
+    return _open() is not None
+
+
+def _key_at(mm, i):
+    start = struct.unpack_from("<I", mm, len(MAGIC) + 4 + 4 * i)[0]
+    return start, mm[start:mm.find(b"\t", start)]
+
+
+@lru_cache(maxsize=4096)
+def _record(key: str):
+    """Binary search for `key`; return its fields or None."""
+    mm = _open()
+    target = key.encode("utf-8")
+    lo, hi = 0, _count
+    while lo < hi:
+        mid = (lo + hi) // 2
+        start, k = _key_at(mm, mid)
+        if k < target:
+            lo = mid + 1
+        elif k > target:
+            hi = mid
+        else:
+            line = mm[start:mm.find(b"\n", start)].decode("utf-8")
+            return line.split("\t")[1:]
+    return None
+
+
+def iter_entries():
+    """Yield (key, pos_tags, plural) for every record, in file order."""
+    mm = _open()
+    if mm is None:
+        return
+    for i in range(_count):
+        start, _ = _key_at(mm, i)
+        key, pos, plural = mm[start:mm.find(b"\n", start)].decode("utf-8").split("\t")[:3]
+        yield key, pos, plural
+
+
+def _has_pos(form: str, pos: str) -> bool:
+    rec = _record(form)
+    return rec is not None and pos in rec[0]
+
+
+# -----------------------------
+# 🔤 Morphy (compiled)
+# -----------------------------
+def _morphy(form: str, pos: str):
+    """
+    WordNet's morphy against the compiled file, as in NLTK 3.10:
+    exception list if the form has one, else every rule applied once.
+    """
+    rec = _record(form)
+    exceptions = rec[6 + POS_ORDER.index(pos)] if rec is not None else ""
+    if exceptions:
+        forms = exceptions.split()
+    else:
+        forms = [form[:-len(old)] + new for old, new in MORPHOLOGICAL_SUBSTITUTIONS[pos] if form.endswith(old)]
+
+    seen, result = set(), []
+    for f in [form] + forms:
+        if f not in seen and _has_pos(f, pos):
+            result.append(f)
+            seen.add(f)
+    return result
+
+
+# -----------------------------
+# 🐢 NLTK Fallback
+# -----------------------------
+def _nltk_wordnet():
+    global _wordnet
+    if _wordnet is None:
+        with _lock:
+            if _wordnet is None:
+                import nltk
+                from nltk.corpus import wordnet
+                nltk.download("wordnet", quiet=True)
+                wordnet.ensure_loaded()
+                _wordnet = wordnet
+    return _wordnet
+
+
+# -----------------------------
+# 📚 Public Lookups
+# -----------------------------
+def morphy(word: str, pos: str):
+    """All base forms of `word` for one POS ('n', 'v', 'a', 'r')."""
+    word = word.lower().strip()
+    if available():
+        return _morphy(word, pos)
+    return _nltk_wordnet()._morphy(word, pos)
+
+
+def synsets_summary(word: str):
+    """Return (pos_tags, first_definition) like wordnet.synsets(word)."""
+    word = word.lower().strip()
+    if not available():
+        synsets = _nltk_wordnet().synsets(word)
+        return {s.pos() for s in synsets}, (synsets[0].definition() if synsets else None)
+
+    pos_tags, definition = set(), None
+    for i, pos in enumerate(POS_ORDER):
+        for form in _morphy(word, pos):
+            pos_tags.add(pos)
+            if definition is None:
+                definition = _record(form)[2 + i]
+    return pos_tags, definition
+
+
+def has_synsets(word: str, pos=None) -> bool:
+    """True if WordNet knows `word` (optionally only for one POS)."""
+    word = word.lower().strip()
+    if not available():
+        return bool(_nltk_wordnet().synsets(word, pos=pos))
+    return any(_morphy(word, p) for p in (pos or POS_ORDER))
+
+
+def lemmatize_verb(word: str) -> str:
+    """Same result as WordNetLemmatizer().lemmatize(word, 'v') on NLTK 3.10."""
+    word = word.lower()
+    lemmas = morphy(word, "v")
+    return min(lemmas, key=len) if lemmas else word
+
+
+def plural(word: str) -> str:
+    """Noun plural – precompiled when possible, inflect otherwise."""
+    global _inflect
+    word = word.lower().strip()
+    if available():
+        rec = _record(word)
+        if rec is not None and "n" in rec[0]:
+            return rec[1] or word
+    if _inflect is None:
+        import inflect
+        _inflect = inflect.engine()
+    return _inflect.plural(word)
@@ -0,0 +1,424 @@
+"""
+LingoBaby core – headless submit / search / explain pipeline
+------------------------------------------------------------
+✅ Everything main.py does, minus Tk: importable from scripts, tests and tools
+✅ submit() / search() / explain() are the public API
+✅ Optional session recording (SESSION_LOG) for replay.py load tests
+File paths are relative to the working directory, like the GUI.
+"""
+
+import re, os, json, time
+from datetime import datetime
+from openpyxl import Workbook, load_workbook
+from docx import Document
+from docx_renderer import add_highlighted_paragraph
+from update_if_irregular_v2 import add_if_irregular
+from lemmatizers import load_irregulars, get_lemmatizer
+from config import LEMMATIZER_BACKEND, CONCORDANCE_FILE, SEARCH_SNIPPETS, SESSION_LOG
+from config import LAZY_OFFICE_VIEWS, LEARNER_LEVEL
+from common_words import load_common_words
+from concordance import ConcordanceIndex
+from submission_queue import enqueue, drain, writer_lock
+from notes_store import NotesStore, VIEWS
+import lexicon
+
+# -----------------------------
+# ⚙️ Initialization
+# -----------------------------
+os.environ["TYPEGUARD_DISABLE"] = "1"
+
+EXCEL_FILE = "SmartVocabularyNotes.xlsx"
+DOC_FILE = "HighlightedNotes.docx"
+SHEET_NAME = "New Words"
+
+
+# -----------------------------
+# 🧩 Irregular Verbs + Lemmatizer
+# -----------------------------
+IRREGULAR_VERBS, IRREGULAR_MAP = load_irregulars()
+_lemmatize = get_lemmatizer(LEMMATIZER_BACKEND, IRREGULAR_VERBS, IRREGULAR_MAP)
+
+
+# -----------------------------
+# 🗒️ Notes Store (lazy Office views)
+# -----------------------------
+store = NotesStore()
+
+
+# -----------------------------
+# 📘 Excel Helpers
+# -----------------------------
+def init_workbook():
+    """Initialize Excel file with header if missing."""
+    if not os.path.exists(EXCEL_FILE):
+        wb = Workbook()
+        ws = wb.active
+        ws.title = SHEET_NAME
+        ws.append(["No.", "New Word", "Sentence", "Explanation", "Date/Time"])
+        wb.save(EXCEL_FILE)
+        return wb, ws
+    wb = load_workbook(EXCEL_FILE)
+    return wb, wb[SHEET_NAME]
+
+
+_excel_words = (None, set())   # (mtime, words) – reread only when the file changes
+
+
+def get_existing_words():
+    """Return set of all saved words (plus any not yet materialized to Excel)."""
+    global _excel_words
+    try:
+        if LAZY_OFFICE_VIEWS and not os.path.exists(EXCEL_FILE):
+            # Never create the view here – materialize() rebuilds a missing one
+            _excel_words = (None, set())
+        elif not os.path.exists(EXCEL_FILE) or os.path.getmtime(EXCEL_FILE) != _excel_words[0]:
+            wb, ws = init_workbook()
+            words = {str(row[1]).lower() for row in ws.iter_rows(min_row=2, values_only=True) if row[1]}
+            _excel_words = (os.path.getmtime(EXCEL_FILE), words)
+        words = set(_excel_words[1])
+    except Exception:
+        words = set()
+    if LAZY_OFFICE_VIEWS:
+        words |= store.words()
+    return words
+
+
+def append_word_rows(ws, words, sentence, explanations, now):
+    """Append one row per new word (explanations may be precomputed)."""
+    next_row = ws.max_row + 1
+    for w in words:
+        ws.append([next_row, w, sentence, explanations.get(w) or get_explanation(w), now])
+        next_row += 1
+
+
+# -----------------------------
+# 📝 Word Document Helpers
+# -----------------------------
+def init_doc():
+    if not os.path.exists(DOC_FILE):
+        doc = Document()
+        doc.add_heading("Highlighted Vocabulary Notes", level=1)
+        doc.save(DOC_FILE)
+    return Document(DOC_FILE)
+
+
+def get_next_num(doc):
+    count = sum(1 for p in doc.paragraphs if re.match(r"^\d+\.", p.text.strip()))
+    return count + 1
+
+
+def append_doc_paragraph(doc, num, sentence, words):
+    targets = {w.lower() for w in words}
+
+    def is_new(word):
+        return get_base_form(re.sub(r"[^\w']", "", word)).lower() in targets
+
+    add_highlighted_paragraph(doc, sentence, is_new, prefix=f"{num}. ", bold_prefix=True)
+
+
+# -----------------------------
+# 📚 Dictionary / Explanation
+# -----------------------------
+def get_base_form(word: str) -> str:
+    """Base form via the lemmatizer backend selected in config.py."""
+    return _lemmatize(word)
+
+
+def get_explanation(word: str) -> str:
+    """Return explanation with correct grammatical logic (noun/verb detection)."""
+    word = word.lower().strip()
+    parts = []
+
+    # Parts of speech + first definition from the compiled dictionary
+    pos_tags, meaning = lexicon.synsets_summary(word)  # e.g., {'n', 'v', 'a'}
+
+    # 1️⃣ If it's a noun → show plural
+    if "n" in pos_tags:
+        plural = lexicon.plural(word)
+        if plural and plural != word:
+            parts.append(f"Plural: {plural}")
+
+    # 2️⃣ If it's a verb → show irregular or regular forms
+    if "v" in pos_tags or word in IRREGULAR_VERBS or word in IRREGULAR_MAP:
+        base = get_base_form(word)
+        if base in IRREGULAR_VERBS:
+            forms = ", ".join(IRREGULAR_VERBS[base])
+            parts.append(f"Verb forms: {base}, {forms}")
+        else:
+            ing = word + "ing" if not word.endswith("ing") else word
+            past = word + "ed" if not word.endswith("ed") else word
+            third = word + "s" if not word.endswith("s") else word
+            parts.append(f"Verb forms: {word}, {ing}, {past}, {third}")
+
+    # 3️⃣ Meaning (always shown if available)
+    if meaning:
+        parts.append(f"Meaning: {meaning}")
+
+    # If nothing matched, fallback meaning only
+    if not parts:
+        parts.append("Meaning: (No definition found)")
+
+    return " | ".join(parts)
+
+
+
+# -----------------------------
+# 🔎 Sentence Concordance
+# -----------------------------
+concordance = ConcordanceIndex(CONCORDANCE_FILE, get_base_form)
+
+
+def saved_sentences():
+    """(sentence, time) for every sentence already in the notebook, oldest first."""
+    seen = set()
+    if os.path.exists(EXCEL_FILE):
+        wb = load_workbook(EXCEL_FILE, read_only=True)
+        try:
+            for row in wb[SHEET_NAME].iter_rows(min_row=2, values_only=True):
+                if len(row) > 2 and row[2] and row[2] not in seen:
+                    seen.add(row[2])
+                    yield str(row[2]), str(row[4] or "") if len(row) > 4 else ""
+        finally:
+            wb.close()
+    if LAZY_OFFICE_VIEWS:
+        for e in store.entries():
+            if e["sentence"] not in seen:
+                seen.add(e["sentence"])
+                yield e["sentence"], e["time"]
+
+
+def bootstrap_concordance():
+    """Index notes saved before the concordance existed (caller holds the writer lock)."""
+    try:
+        concordance.bootstrap(saved_sentences())
+    except Exception as e:
+        print(f"⚠️ Failed to index previously saved sentences: {e}")
+
+
+if not os.path.exists(CONCORDANCE_FILE):
+    try:
+        with writer_lock(timeout=0):
+            bootstrap_concordance()
+    except TimeoutError:
+        pass   # the current writer builds it in apply_submissions()
+
+
+# -----------------------------
+# 🧠 Word Extraction
+# -----------------------------
+COMMON_WORDS = load_common_words(LEARNER_LEVEL)
+
+
+def extract_new_words(sentence, existing):
+    tokens = re.findall(r"\b[a-zA-Z']+\b", sentence)
+    new_words = []
+    for t in tokens:
+        # Frequent words are skipped before any dictionary work
+        if t.lower() in COMMON_WORDS:
+            continue
+        base = get_base_form(t)
+        if base.lower() not in existing and base.lower() not in COMMON_WORDS:
+            new_words.append(base)
+    return new_words
+
+
+# -----------------------------
+# 📬 Batched Writer
+# -----------------------------
+def apply_submissions(sentences, explanations=None):
+    """
+    Save a batch of sentences with one workbook save and one document save.
+    Must run under the writer lock (see submission_queue.drain).
+    Returns the list of new words saved for each sentence.
+    """
+    explanations = explanations or {}
+    bootstrap_concordance()
+    if LAZY_OFFICE_VIEWS:
+        # Office files are views – only the notes store is written here
+        existing = get_existing_words()
+    else:
+        wb, ws = init_workbook()
+        existing = {str(row[1]).lower() for row in ws.iter_rows(min_row=2, values_only=True) if row[1]}
+        doc = init_doc()
+        num = get_next_num(doc)
+    results, saved = [], []   # saved: (sentence, time) to index once written
+
+    for sentence in sentences:
+        new_words = extract_new_words(sentence, existing)
+        results.append(new_words)
+        if not new_words:
+            continue
+        for w in new_words:
+            try:
+                add_if_irregular(w)
+            except Exception as e:
+                print(f"(⚠️ Skipped irregular check for '{w}': {e})")
+
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if LAZY_OFFICE_VIEWS:
+            store.append(sentence, new_words, {w: explanations.get(w) or get_explanation(w) for w in new_words}, now)
+            concordance.add(sentence, now)
+        else:
+            append_word_rows(ws, new_words, sentence, explanations, now)
+            append_doc_paragraph(doc, num, sentence, new_words)
+            num += 1
+            saved.append((sentence, now))
+        existing.update(w.lower() for w in new_words)
+
+    if saved:
+        # Index only after the save, so a failed batch can be retried cleanly
+        wb.save(EXCEL_FILE)
+        doc.save(DOC_FILE)
+        for sentence, now in saved:
+            concordance.add(sentence, now)
+    return results
+
+
+def _excel_contains():
+    """Predicate: are all of an entry's words already rows in the workbook?"""
+    wb = load_workbook(EXCEL_FILE, read_only=True)
+    try:
+        words = {str(row[1]).lower() for row in wb[SHEET_NAME].iter_rows(min_row=2, values_only=True) if row[1]}
+    finally:
+        wb.close()
+    return lambda e: all(w.lower() in words for w in e["words"])
+
+
+def _doc_contains():
+    """Predicate: is an entry's sentence already a numbered paragraph?"""
+    texts = {re.sub(r"^\d+\.\s*", "", p.text.strip()) for p in Document(DOC_FILE).paragraphs}
+    return lambda e: e["sentence"].strip() in texts
+
+
+def _materialize_excel():
+    entries, mark = store.pending("excel", EXCEL_FILE, _excel_contains)
+    if entries or not os.path.exists(EXCEL_FILE):
+        wb, ws = init_workbook()
+        for e in entries:
+            append_word_rows(ws, e["words"], e["sentence"], e["explanations"], e["time"])
+        wb.save(EXCEL_FILE)
+        store.mark_materialized("excel", mark, EXCEL_FILE)
+
+
+def _materialize_doc():
+    entries, mark = store.pending("doc", DOC_FILE, _doc_contains)
+    if entries or not os.path.exists(DOC_FILE):
+        doc = init_doc()
+        num = get_next_num(doc)
+        for e in entries:
+            append_doc_paragraph(doc, num, e["sentence"], e["words"])
+            num += 1
+        doc.save(DOC_FILE)
+        store.mark_materialized("doc", mark, DOC_FILE)
+
+
+def materialize(views=VIEWS):
+    """
+    Bring dirty Office views up to date with the notes store (lazy mode only).
+    Never raises: a view that cannot be written (e.g. open in Office) stays
+    dirty and is retried next time.
+    """
+    if not LAZY_OFFICE_VIEWS:
+        return
+    try:
+        with writer_lock():
+            for view, refresh in (("excel", _materialize_excel), ("doc", _materialize_doc)):
+                if view in views:
+                    try:
+                        refresh()
+                    except Exception as e:
+                        print(f"(⚠️ {view} view not refreshed: {e})")
+    except TimeoutError as e:
+        print(f"(⚠️ Views not refreshed: {e})")
+
+
+# -----------------------------
+# 🎙️ Session Recording
+# -----------------------------
+_session_log = SESSION_LOG or None
+
+
+def record_session(path):
+    """Append every API call to `path` as JSON lines (None stops recording)."""
+    global _session_log
+    _session_log = path or None
+
+
+def _record(op, arg):
+    if not _session_log:
+        return
+    try:
+        with open(_session_log, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"t": time.time(), "op": op, "arg": arg}, ensure_ascii=False) + "\n")
+    except Exception as e:
+        print(f"⚠️ Failed to record session: {e}")
+
+
+# -----------------------------
+# 🔌 Public API
+# -----------------------------
+def submit(sentence, explanations=None, source="api"):
+    """
+    Queue a sentence, then save the whole queue unless another process is the writer.
+    Returns {"queued": True} when left for the active writer, otherwise
+    {"queued": False, "words": new words saved for this sentence,
+     "batch": {submission id: words, or the error if set aside} for the batch}.
+    Raises OSError if the notebook cannot be written (sentence stays queued),
+    or the sentence's own error if it was set aside as .failed.
+    """
+    _record("submit", sentence)
+    sub_id = enqueue(sentence, source=source)
+    results = drain(lambda sentences: apply_submissions(sentences, explanations))
+    if results is None:
+        return {"queued": True, "words": [], "batch": {}}
+    words = results.get(sub_id)
+    if isinstance(words, Exception):
+        raise words   # this sentence could not be saved and was set aside
+    return {"queued": False, "words": words or [], "batch": results}
+
+
+def apply_pending():
+    """Save sentences queued by other front-ends; {submission id: words or error} or None if busy."""
+    return drain(apply_submissions)
+
+
+def search(word, limit=SEARCH_SNIPPETS):
+    """
+    Look up a saved word and every sentence using any of its forms.
+    Returns {"base", "entry" (sentence/explanation/added or None),
+             "sentences" [(sentence, snippet)], "total"}.
+    """
+    _record("search", word)
+    word = word.strip().lower()
+    base = get_base_form(word)
+    result = {
+        "base": base,
+        "entry": None,
+        "sentences": concordance.search(word, limit=limit),
+        "total": concordance.count(word),
+    }
+
+    if LAZY_OFFICE_VIEWS:
+        # The notes store holds every word saved in lazy mode, materialized or not
+        e = store.find(base)
+        if e is not None:
+            w = next(w for w in e["words"] if w.lower() == base)
+            result["entry"] = {"sentence": e["sentence"], "explanation": e["explanations"].get(w), "added": e["time"]}
+            return result
+
+    if os.path.exists(EXCEL_FILE):
+        wb = load_workbook(EXCEL_FILE, read_only=True)
+        try:
+            for row in wb[SHEET_NAME].iter_rows(min_row=2, values_only=True):
+                if row[1] and str(row[1]).lower() == base:
+                    result["entry"] = {"sentence": row[2], "explanation": row[3], "added": row[4]}
+                    break
+        finally:
+            wb.close()
+    return result
+
+
+def explain(word):
+    """Explanation text for one word (noun plural, verb forms, meaning)."""
+    _record("explain", word)
+    return get_explanation(word)
@@ -0,0 +1,99 @@
+"""
+👀 Live new-word preview
+-----------------------
+✅ Incremental tokenization – only text after the first edited character is re-scanned
+✅ Base forms cached per token, so unchanged words never hit the dictionary again
+✅ Explanations for candidate new words prefetched on a worker thread
+The GUI calls analyze() (debounced) on every keystroke; on submit it reuses
+new_words() / explanations() instead of recomputing.
+"""
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+TOKEN_RE = re.compile(r"\b[a-zA-Z']+\b")
+
+
+class PreviewAnalyzer:
+    def __init__(self, get_base_form, get_explanation, existing_words, common_words=frozenset()):
+        self._base_form = get_base_form
+        self._explain = get_explanation
+        self.existing = set(existing_words)
+        self.common = common_words
+        self._text = ""
+        self._tokens = []        # [(start, end, token)] for self._text
+        self._bases = {}         # token -> base form
+        self._prefetch = {}      # base form -> Future[explanation]
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lingo-prefetch")
+
+    # -----------------------------
+    # 🔤 Tokenization
+    # -----------------------------
+    def _retokenize(self, text):
+        """Reuse tokens that end before the first changed character."""
+        same = 0
+        limit = min(len(text), len(self._text))
+        while same < limit and text[same] == self._text[same]:
+            same += 1
+
+        # The last kept token may still grow: "don'" tokenizes as "don" until
+        # the "t" arrives, so rescan from its start rather than its end
+        kept = [t for t in self._tokens if t[1] < same]
+        rescan_from = kept.pop()[0] if kept else 0
+        kept += [(m.start(), m.end(), m.group()) for m in TOKEN_RE.finditer(text, rescan_from)]
+        self._text, self._tokens = text, kept
+
+    def _base(self, token):
+        base = self._bases.get(token)
+        if base is None:
+            base = self._bases[token] = self._base_form(token)
+        return base
+
+    def _is_new(self, token):
+        # Same rule as lingo_core.extract_new_words: common words never reach the lemmatizer
+        if token.lower() in self.common:
+            return False
+        base = self._base(token).lower()
+        return base not in self.existing and base not in self.common
+
+    # -----------------------------
+    # 🧠 Analysis
+    # -----------------------------
+    def analyze(self, text):
+        """Return [(start, end, is_new)] spans and prefetch explanations for new words."""
+        self._retokenize(text)
+        spans = []
+        for start, end, token in self._tokens:
+            is_new = self._is_new(token)
+            base = self._bases.get(token)
+            if is_new and base not in self._prefetch:
+                self._prefetch[base] = self._executor.submit(self._explain, base)
+            spans.append((start, end, is_new))
+        return spans
+
+    def new_words(self, text):
+        """Same result as lingo_core.extract_new_words, served from the cache."""
+        if text != self._text:
+            self._retokenize(text)
+        return [self._base(t) for _, _, t in self._tokens if self._is_new(t)]
+
+    def explanations(self, words):
+        """Prefetched explanations (waits for any still running)."""
+        result = {}
+        for w in words:
+            future = self._prefetch.get(w)
+            try:
+                result[w] = future.result() if future else self._explain(w)
+            except Exception as e:
+                print(f"(⚠️ Prefetch failed for '{w}': {e})")
+                result[w] = self._explain(w)
+        return result
+
+    def mark_saved(self, words):
+        """Saved words are no longer new; drop their prefetched explanations."""
+        for w in words:
+            self.existing.add(w.lower())
+            self._prefetch.pop(w, None)
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -5,192 +5,52 @@ LingoBaby – Smart Vocabulary (v3 Optimized)
 ✅ Auto-learns new irregulars (no external libs)
 ✅ Saves to Excel + Word
 ✅ Works offline and with PyInstaller
+Tk front-end only – the pipeline lives in lingo_core.py.
 """
 
 import tkinter as tk
 from tkinter import messagebox
-import re, os, subprocess, json
-from datetime import datetime
-import inflect
-import nltk
-from nltk.corpus import wordnet
-from openpyxl import Workbook, load_workbook
-from docx import Document
-from docx.enum.text import WD_COLOR_INDEX
-from update_if_irregular_v2 import add_if_irregular
+import os, subprocess
+from config import PREVIEW_DELAY_MS, SEARCH_SNIPPETS, QUEUE_POLL_MS, LAZY_OFFICE_VIEWS, MATERIALIZE_INTERVAL_MS
+from submission_queue import pending
+from live_preview import PreviewAnalyzer
+from lingo_core import (
+    EXCEL_FILE, DOC_FILE, COMMON_WORDS, get_base_form, get_explanation, get_existing_words,
+    materialize, submit, apply_pending, search,
+)
 
-# -----------------------------
-# ⚙️ Initialization
-# -----------------------------
-os.environ["TYPEGUARD_DISABLE"] = "1"
-nltk.download("wordnet", quiet=True)
-
-p = inflect.engine()
-EXCEL_FILE = "SmartVocabularyNotes.xlsx"
-DOC_FILE = "HighlightedNotes.docx"
-SHEET_NAME = "New Words"
 ICON_FILE = "LingoBaby.ico"
-IRREGULAR_JSON = "irregular_verbs_extended.json"
 
 
 # -----------------------------
-# 🧩 Irregular Verbs Loader
+# ⏲️ Background Jobs
 # -----------------------------
-def load_irregulars():
-    """Load irregular verbs from JSON file once."""
-    if not os.path.exists(IRREGULAR_JSON):
-        print(f"⚠️ JSON not found: {IRREGULAR_JSON}")
-        return {}, {}
+def materialize_timer():
     try:
-        with open(IRREGULAR_JSON, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        verbs = {v["base"].lower(): [v["past"], v["past_participle"], v["ing"], v["s"]] for v in data}
-        mapping = {form.lower(): base.lower() for base, forms in verbs.items() for form in forms}
-        return verbs, mapping
-    except Exception as e:
-        print(f"⚠️ Failed to read irregular verbs JSON: {e}")
-        return {}, {}
+        materialize()
+    finally:
+        entry.after(MATERIALIZE_INTERVAL_MS, materialize_timer)
 
-IRREGULAR_VERBS, IRREGULAR_MAP = load_irregulars()
 
-
-# -----------------------------
-# 📘 Excel Helpers
-# -----------------------------
-def init_workbook():
-    """Initialize Excel file with header if missing."""
-    if not os.path.exists(EXCEL_FILE):
-        wb = Workbook()
-        ws = wb.active
-        ws.title = SHEET_NAME
-        ws.append(["No.", "New Word", "Sentence", "Explanation", "Date/Time"])
-        wb.save(EXCEL_FILE)
-        return wb, ws
-    wb = load_workbook(EXCEL_FILE)
-    return wb, wb[SHEET_NAME]
-
-
-def get_existing_words():
-    """Return set of all saved words."""
+def poll_queue():
+    """Apply sentences queued by other front-ends (e.g. bulk_ingest.py)."""
     try:
-        wb, ws = init_workbook()
-        return {str(row[1]).lower() for row in ws.iter_rows(min_row=2, values_only=True) if row[1]}
-    except Exception:
-        return set()
-
-
-def add_new_sentence(words, sentence):
-    """Append new words to Excel."""
-    wb, ws = init_workbook()
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    next_row = ws.max_row + 1
-    for w in words:
-        ws.append([next_row, w, sentence, get_explanation(w), now])
-        next_row += 1
-    wb.save(EXCEL_FILE)
-
-
-# -----------------------------
-# 📝 Word Document Helpers
-# -----------------------------
-def init_doc():
-    if not os.path.exists(DOC_FILE):
-        doc = Document()
-        doc.add_heading("Highlighted Vocabulary Notes", level=1)
-        doc.save(DOC_FILE)
-    return Document(DOC_FILE)
-
-
-def get_next_num(doc):
-    count = sum(1 for p in doc.paragraphs if re.match(r"^\d+\.", p.text.strip()))
-    return count + 1
-
-
-def add_sentence_to_doc(sentence, words):
-    doc = init_doc()
-    num = get_next_num(doc)
-    p = doc.add_paragraph()
-    p.add_run(f"{num}. ").bold = True
-
-    for word in sentence.split():
-        clean = re.sub(r"[^\w']", "", word)
-        base = get_base_form(clean)
-        run = p.add_run(word + " ")
-        if base.lower() in [w.lower() for w in words]:
-            run.bold = True
-            run.font.highlight_color = WD_COLOR_INDEX.YELLOW
-    doc.save(DOC_FILE)
-
-
-# -----------------------------
-# 📚 Dictionary / Explanation
-# -----------------------------
-def get_base_form(word: str) -> str:
-    w = word.lower().strip()
-    if w in IRREGULAR_VERBS:
-        return w
-    if w in IRREGULAR_MAP:
-        return IRREGULAR_MAP[w]
-    for suf in ["ing", "ed", "es", "s"]:
-        if w.endswith(suf) and len(w) > len(suf) + 1:
-            base = w[:-len(suf)]
-            if wordnet.synsets(base):
-                return base
-    return w
-
-
-def get_explanation(word: str) -> str:
-    """Return explanation with correct grammatical logic (noun/verb detection)."""
-    word = word.lower().strip()
-    parts = []
-
-    # Get synsets and their parts of speech
-    synsets = wordnet.synsets(word)
-    pos_tags = {s.pos() for s in synsets}  # e.g., {'n', 'v', 'a'}
-
-    # 1️⃣ If it's a noun → show plural
-    if "n" in pos_tags:
-        plural = p.plural(word)
-        if plural and plural != word:
-            parts.append(f"Plural: {plural}")
-
-    # 2️⃣ If it's a verb → show irregular or regular forms
-    if "v" in pos_tags or word in IRREGULAR_VERBS or word in IRREGULAR_MAP:
-        base = get_base_form(word)
-        if base in IRREGULAR_VERBS:
-            forms = ", ".join(IRREGULAR_VERBS[base])
-            parts.append(f"Verb forms: {base}, {forms}")
-        else:
-            ing = word + "ing" if not word.endswith("ing") else word
-            past = word + "ed" if not word.endswith("ed") else word
-            third = word + "s" if not word.endswith("s") else word
-            parts.append(f"Verb forms: {word}, {ing}, {past}, {third}")
-
-    # 3️⃣ Meaning (always shown if available)
-    if synsets:
-        meaning = synsets[0].definition()
-        parts.append(f"Meaning: {meaning}")
-
-    # If nothing matched, fallback meaning only
-    if not parts:
-        parts.append("Meaning: (No definition found)")
-
-    return " | ".join(parts)
-
-
-
-# -----------------------------
-# 🧠 Word Extraction
-# -----------------------------
-def extract_new_words(sentence, existing):
-    tokens = re.findall(r"\b[a-zA-Z']+\b", sentence)
-    return [get_base_form(t) for t in tokens if get_base_form(t).lower() not in existing]
+        if pending():
+            results = apply_pending()
+            for words in (results or {}).values():
+                if not isinstance(words, Exception):
+                    preview.mark_saved(words)
+    except Exception as e:
+        print(f"(⚠️ Queued sentences not saved yet: {e})")
+    finally:
+        entry.after(QUEUE_POLL_MS, poll_queue)
 
 
 # -----------------------------
 # 🔍 Open / Search / Add
 # -----------------------------
 def open_excel():
+    materialize(("excel",))
     if os.path.exists(EXCEL_FILE):
         subprocess.Popen(["start", EXCEL_FILE], shell=True)
     else:
@@ -198,33 +58,67 @@ def open_excel():
 
 
 def open_doc():
+    materialize(("doc",))
     if os.path.exists(DOC_FILE):
         subprocess.Popen(["start", DOC_FILE], shell=True)
     else:
         messagebox.showwarning("Not found", "Doc file not found.")
 
 
+def used_in_text(result):
+    """'Used in N sentences' block with highlighted snippets (empty if none)."""
+    total = result["total"]
+    if not total:
+        return ""
+    lines = [f"• {snippet}" for _, snippet in result["sentences"]]
+    if total > SEARCH_SNIPPETS:
+        lines.append(f"… and {total - SEARCH_SNIPPETS} more")
+    return f"\n\n🔎 Used in {total} sentence(s):\n" + "\n".join(lines)
+
+
 def search_word():
     word = entry.get().strip().lower()
     if not word:
         messagebox.showwarning("Empty", "Enter a word to search.")
         return
 
-    base = get_base_form(word)
-    if not os.path.exists(EXCEL_FILE):
+    result = search(word)
+    base, found = result["base"], result["entry"]
+    used_in = used_in_text(result)
+    if found:
+        messagebox.showinfo(
+            "Found",
+            f"✅ '{base}' found!\n\n📖 Sentence: {found['sentence']}\n💬 Explanation: {found['explanation']}\n🕓 Added: {found['added']}{used_in}",
+        )
+    elif used_in:
+        messagebox.showinfo("Sentences", f"'{word}' is not a saved word yet.{used_in}")
+    elif not os.path.exists(EXCEL_FILE):
         messagebox.showwarning("Missing", "Excel not found.")
-        return
+    else:
+        messagebox.showinfo("Not Found", f"❌ '{word}' not in your list.")
+
+
+def update_preview():
+    """Highlight the words that would be new (runs debounced after typing)."""
+    global _preview_job
+    _preview_job = None
+    text = entry.get()
+    spans = preview.analyze(text)
+    preview_box.config(state=tk.NORMAL)
+    preview_box.delete("1.0", tk.END)
+    preview_box.insert("1.0", text)
+    for start, end, is_new in spans:
+        if is_new:
+            preview_box.tag_add("new", f"1.0+{start}c", f"1.0+{end}c")
+    preview_box.config(state=tk.DISABLED)
+
 
-    wb = load_workbook(EXCEL_FILE)
-    ws = wb[SHEET_NAME]
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        if row[1] and str(row[1]).lower() == base:
-            messagebox.showinfo(
-                "Found",
-                f"✅ '{base}' found!\n\n📖 Sentence: {row[2]}\n💬 Explanation: {row[3]}\n🕓 Added: {row[4]}",
-            )
-            return
-    messagebox.showinfo("Not Found", f"❌ '{word}' not in your list.")
+def schedule_preview(_event=None):
+    """Debounce: restart the timer on every keystroke."""
+    global _preview_job
+    if _preview_job is not None:
+        entry.after_cancel(_preview_job)
+    _preview_job = entry.after(PREVIEW_DELAY_MS, update_preview)
 
 
 def on_submit():
@@ -233,24 +127,43 @@ def on_submit():
         messagebox.showwarning("Empty", "Please enter a sentence.")
         return
 
-    existing = get_existing_words()
-    new_words = extract_new_words(sentence, existing)
+    # Base forms + explanations were already computed while typing
+    new_words = preview.new_words(sentence)
 
     if not new_words:
         messagebox.showinfo("Info", "No new words found.")
         return
 
-    for w in new_words:
-        try:
-            add_if_irregular(w)
-        except Exception as e:
-            print(f"(⚠️ Skipped irregular check for '{w}': {e})")
-
-    add_new_sentence(new_words, sentence)
-    add_sentence_to_doc(sentence, new_words)
-    messagebox.showinfo("Success", f"Added: {', '.join(new_words)}")
+    # Queue it, then save the whole queue in one batch unless another
+    # LingoBaby process is already the writer
+    try:
+        result = submit(sentence, preview.explanations(new_words), source="main")
+    except OSError as e:
+        # Still queued – poll_queue() retries once the files can be written
+        entry.delete(0, tk.END)
+        preview.mark_saved(new_words)
+        messagebox.showerror("Not saved yet", f"Could not write your notes (open in Excel/Word?).\nYour sentence is queued and will be saved automatically.\n\n{e}")
+        update_preview()
+        return
+    except Exception as e:
+        messagebox.showerror("Error", f"Could not save this sentence: {e}")
+        return
     entry.delete(0, tk.END)
 
+    if result["queued"]:
+        preview.mark_saved(new_words)
+        messagebox.showinfo("Queued", "Another LingoBaby window is saving – your sentence is queued and will be added.")
+    else:
+        for words in result["batch"].values():
+            if not isinstance(words, Exception):
+                preview.mark_saved(words)
+        saved = result["words"]
+        if saved:
+            messagebox.showinfo("Success", f"Added: {', '.join(saved)}")
+        else:
+            messagebox.showinfo("Info", "No new words found.")
+    update_preview()
+
 
 # -----------------------------
 # 🪟 GUI
@@ -258,7 +171,7 @@ def on_submit():
 def start_gui():
     root = tk.Tk()
     root.title("LingoBaby – Smart Vocabulary")
-    root.geometry("660x360")
+    root.geometry("660x440")
 
     if os.path.exists(ICON_FILE):
         try:
@@ -267,9 +180,17 @@ def start_gui():
             pass
 
     tk.Label(root, text="Enter a sentence or word:", font=("Segoe UI", 11, "bold")).pack(pady=8)
-    global entry
+    global entry, preview, preview_box, _preview_job
     entry = tk.Entry(root, width=75)
     entry.pack(pady=5)
+    entry.bind("<KeyRelease>", schedule_preview)
+
+    # 👀 Live preview: new words highlighted before submit
+    preview = PreviewAnalyzer(get_base_form, get_explanation, get_existing_words(), COMMON_WORDS)
+    _preview_job = None
+    preview_box = tk.Text(root, width=75, height=3, wrap=tk.WORD, state=tk.DISABLED, bg=root.cget("bg"), relief=tk.FLAT)
+    preview_box.tag_configure("new", background="yellow", font=("Segoe UI", 9, "bold"))
+    preview_box.pack(pady=5)
 
     frame = tk.Frame(root)
     frame.pack(pady=12)
@@ -278,8 +199,20 @@ def start_gui():
     tk.Button(frame, text="📊 View Excel", width=18, command=open_excel).grid(row=1, column=0, padx=6)
     tk.Button(frame, text="📝 View Doc", width=18, command=open_doc).grid(row=1, column=1, padx=6)
 
-    tk.Label(root, text="Tip: Use base words (e.g. 'go', not 'goes').", fg="gray").pack(pady=8)
+    tk.Label(root, text="Tip: Search 'go' (or 'go/went/gone') to see every sentence using it.", fg="gray").pack(pady=8)
+    entry.after(QUEUE_POLL_MS, poll_queue)
+    if LAZY_OFFICE_VIEWS:
+        entry.after(MATERIALIZE_INTERVAL_MS, materialize_timer)
+
+    def on_close():
+        try:
+            materialize()
+        finally:
+            root.destroy()
+
+    root.protocol("WM_DELETE_WINDOW", on_close)
     root.mainloop()
+    preview.close()
 
 
 # -----------------------------
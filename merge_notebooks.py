@@ -0,0 +1,117 @@
+"""
+🤝 Merge vocabulary notebooks
+----------------------------
+✅ Streams every SmartVocabularyNotes.xlsx in read-only mode (rows never all in memory)
+✅ Hash join on the normalized base form – earliest Date/Time wins
+✅ Renumbers "No." and writes the result in write-only mode
+Memory grows with distinct words, not total rows; time is linear in rows.
+Run: python merge_notebooks.py Combined.xlsx alice.xlsx bob.xlsx ...
+"""
+
+import sys
+from datetime import datetime
+from openpyxl import Workbook, load_workbook
+from config import SHEET_NAME
+from helpers import clean_word_for_compare
+from lemmatizers import get_lemmatizer
+
+HEADER = ["No.", "New Word", "Sentence", "Explanation", "Date/Time"]
+
+# Header spellings used by main.py, excel_handler.py and SpeakAndLearn.py
+COLUMN_NAMES = {
+    "word": ("new word", "new words"),
+    "sentence": ("sentence",),
+    "explanation": ("explanation",),
+    "stamp": ("date/time",),
+}
+DEFAULT_COLUMNS = {"word": 1, "sentence": 2, "explanation": 3, "stamp": 4}
+
+
+def _columns(header):
+    """Map field -> column index from a header row (falls back to main.py layout)."""
+    names = [str(h).strip().lower() if h is not None else "" for h in header or ()]
+    cols = {}
+    for field, spellings in COLUMN_NAMES.items():
+        cols[field] = next((i for i, n in enumerate(names) if n in spellings), None)
+    if cols["word"] is None:
+        return dict(DEFAULT_COLUMNS)
+    return cols
+
+
+def _stamp(value):
+    """Date/Time as the sortable text main.py writes."""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    return str(value).strip() if value is not None else ""
+
+
+def iter_notebook_rows(path):
+    """Yield (word, sentence, explanation, stamp) from one notebook, streaming."""
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[SHEET_NAME] if SHEET_NAME in wb.sheetnames else wb.active
+        rows = ws.iter_rows(values_only=True)
+        cols = _columns(next(rows, None))
+
+        def cell(row, field):
+            i = cols[field]
+            return row[i] if i is not None and i < len(row) else None
+
+        for row in rows:
+            word = cell(row, "word")
+            sentence = cell(row, "sentence")
+            if not word and not sentence:
+                continue
+            yield (
+                str(word).strip() if word else "",
+                str(sentence) if sentence else "",
+                str(cell(row, "explanation") or ""),
+                _stamp(cell(row, "stamp")),
+            )
+    finally:
+        wb.close()
+
+
+def merge_notebooks(paths, out_path):
+    """Merge notebooks into out_path; return (rows read, rows written)."""
+    lemmatize = get_lemmatizer()
+    bases = {}      # word -> normalized base form (each spelling lemmatized once)
+    merged = {}     # key -> (word, sentence, explanation, stamp)
+    read = 0
+
+    for path in paths:
+        for row in iter_notebook_rows(path):
+            read += 1
+            word, sentence, _, stamp = row
+            if word:
+                key = bases.get(word)
+                if key is None:
+                    key = bases[word] = clean_word_for_compare(lemmatize(word))
+            else:
+                # Sentence-only rows (excel_handler) dedupe on the sentence itself
+                key = "\0" + sentence.strip().lower()
+
+            kept = merged.get(key)
+            if kept is None:
+                merged[key] = row
+            elif stamp and (not kept[3] or stamp < kept[3]):
+                # Earlier entry wins, but keep an explanation the other one had
+                merged[key] = row if row[2] else row[:2] + (kept[2], stamp)
+            elif not kept[2] and row[2]:
+                merged[key] = kept[:2] + (row[2], kept[3])
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(SHEET_NAME)
+    ws.append(HEADER)
+    for no, (word, sentence, explanation, stamp) in enumerate(merged.values(), start=1):
+        ws.append([no, word, sentence, explanation, stamp])
+    wb.save(out_path)
+    return read, len(merged)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage: python merge_notebooks.py OUTPUT.xlsx INPUT.xlsx [INPUT.xlsx ...]")
+        sys.exit(1)
+    read, written = merge_notebooks(sys.argv[2:], sys.argv[1])
+    print(f"✅ Merged {read} rows from {len(sys.argv) - 2} notebooks into {written} rows: {sys.argv[1]}")
@@ -0,0 +1,132 @@
+"""
+🗒️ Notes store – lightweight source of truth for lazy Office views
+-----------------------------------------------------------------
+✅ Each saved sentence is one appended JSON line (words + explanations + time)
+✅ Entries, the word set and a word → entry index are kept in memory; the file
+   is only read again (from the last known offset) when another process grew it
+✅ SmartVocabularyNotes.xlsx / HighlightedNotes.docx become materialized views:
+   the state file records how many entries each view contains plus the view
+   file's size/mtime, so a view edited, replaced or deleted behind our back is
+   reconciled against its actual contents instead of trusting the count
+Only used when LAZY_OFFICE_VIEWS is on (see config.py).
+"""
+
+import json, os
+from config import NOTES_STORE_FILE, NOTES_STATE_FILE
+
+VIEWS = ("excel", "doc")
+
+
+class NotesStore:
+    def __init__(self, path=NOTES_STORE_FILE, state_path=NOTES_STATE_FILE):
+        self.path = path
+        self.state_path = state_path
+        self._reset()
+
+    def _reset(self):
+        self._entries = []
+        self._words = set()
+        self._first = {}        # word -> first entry using it
+        self._offset = 0        # bytes of the file already parsed
+        self._stat = None       # (size, mtime_ns) when last synced
+
+    def _add(self, entry):
+        self._entries.append(entry)
+        for w in entry["words"]:
+            self._words.add(w.lower())
+            self._first.setdefault(w.lower(), entry)
+
+    # -----------------------------
+    # 🔄 Sync With Disk
+    # -----------------------------
+    def _refresh(self):
+        """Parse only what other processes appended since the last sync."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            if self._stat is not None:
+                self._reset()
+            return
+        if (st.st_size, st.st_mtime_ns) == self._stat:
+            return
+        if st.st_size < self._offset:
+            self._reset()   # truncated or replaced – start over
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        complete = data.rfind(b"\n") + 1   # a line still being written is picked up next time
+        for line in data[:complete].splitlines():
+            if line.strip():
+                self._add(json.loads(line))
+        self._offset += complete
+        self._stat = (st.st_size, st.st_mtime_ns)
+
+    # -----------------------------
+    # 💾 Entries
+    # -----------------------------
+    def append(self, sentence, words, explanations, timestamp):
+        self._refresh()
+        entry = {"sentence": sentence, "words": words, "explanations": explanations, "time": timestamp}
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        with open(self.path, "ab") as f:
+            start = f.tell()
+            f.write(line)
+        if start == self._offset:
+            self._add(entry)
+            self._offset += len(line)
+            st = os.stat(self.path)
+            self._stat = (st.st_size, st.st_mtime_ns)
+        else:
+            self._refresh()   # someone else appended in between
+
+    def entries(self):
+        """All entries, including other processes' appends."""
+        self._refresh()
+        return self._entries
+
+    def words(self):
+        self._refresh()
+        return self._words
+
+    def find(self, word):
+        """First entry that saved `word`, or None."""
+        self._refresh()
+        return self._first.get(word.lower())
+
+    # -----------------------------
+    # 🧮 View State
+    # -----------------------------
+    def _state(self):
+        if not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ Failed to read view state: {e}")
+            return {}
+
+    def pending(self, view, view_path, contains):
+        """
+        (entries missing from `view`, new mark). A missing view file is rebuilt
+        from the whole store; one changed outside the app is checked entry by
+        entry with contains() -> predicate(entry), which may read the file.
+        """
+        entries = self.entries()
+        if not os.path.exists(view_path):
+            return list(entries), len(entries)
+        st = os.stat(view_path)
+        saved = self._state().get(view)
+        if isinstance(saved, dict) and [saved.get("size"), saved.get("mtime_ns")] == [st.st_size, st.st_mtime_ns]:
+            return entries[saved["count"]:], len(entries)
+        present = contains()
+        return [e for e in entries if not present(e)], len(entries)
+
+    def mark_materialized(self, view, count, view_path):
+        st = os.stat(view_path)
+        state = self._state()
+        state[view] = {"count": count, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        tmp = self.state_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.state_path)
@@ -0,0 +1,109 @@
+"""
+🔁 Session replay load generator
+-------------------------------
+✅ Replays a recorded session (SESSION_LOG in config.py) through lingo_core
+✅ Runs against a throwaway notebook folder, never your real notes
+✅ Recorded pacing (optionally sped up) or a fixed rate in ops/second
+✅ Reports p50 / p95 / p99 latency per operation and how far the run fell behind
+Run: python replay.py session.jsonl [--rate 5 | --speed 10] [--repeat 3] [--workdir DIR]
+"""
+
+import argparse, json, os, shutil, sys, tempfile, time
+from config import IRREGULAR_JSON
+
+
+def load_session(path):
+    with open(path, "r", encoding="utf-8") as f:
+        events = [json.loads(line) for line in f if line.strip()]
+    return [e for e in events if e.get("op") in ("submit", "search", "explain")]
+
+
+def schedule(events, rate=None, speed=1.0, repeat=1):
+    """Return [(offset seconds, op, arg)] – fixed rate, or recorded gaps / speed."""
+    plan, offset = [], 0.0
+    for _ in range(repeat):
+        prev_t = None
+        for e in events:
+            if rate:
+                gap = 1.0 / rate
+            else:
+                gap = 0.0 if prev_t is None else max(0.0, e["t"] - prev_t) / speed
+            prev_t = e["t"]
+            offset += gap if plan else 0.0
+            plan.append((offset, e["op"], e["arg"]))
+    return plan
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-pct * len(sorted_values) // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def run(plan, core):
+    """Execute the plan open-loop; return ({op: [latencies]}, [lags], elapsed seconds)."""
+    ops = {"submit": core.submit, "search": core.search, "explain": core.explain}
+    latencies, lags = {}, []
+    start = time.perf_counter()
+    for offset, op, arg in plan:
+        wait = start + offset - time.perf_counter()
+        if wait > 0:
+            time.sleep(wait)
+        lags.append(max(0.0, -wait))
+        t0 = time.perf_counter()
+        try:
+            ops[op](arg)
+        except Exception as e:
+            print(f"⚠️ {op}({arg!r}) failed: {e}")
+        latencies.setdefault(op, []).append(time.perf_counter() - t0)
+    return latencies, lags, time.perf_counter() - start
+
+
+def report(latencies, lags, elapsed):
+    total = sum(len(v) for v in latencies.values())
+    print(f"\n{total} ops in {elapsed:.1f}s ({total / elapsed if elapsed else 0:.1f} ops/s)")
+    print(f"{'op':<8} {'count':>6} {'p50 (ms)':>10} {'p95 (ms)':>10} {'p99 (ms)':>10} {'max (ms)':>10}")
+    for op, values in sorted(latencies.items()):
+        values = sorted(values)
+        p50, p95, p99 = (percentile(values, p) * 1000 for p in (50, 95, 99))
+        print(f"{op:<8} {len(values):>6} {p50:>10.1f} {p95:>10.1f} {p99:>10.1f} {values[-1] * 1000:>10.1f}")
+    lags = sorted(lags)
+    print(f"\nSchedule lag: p95 {percentile(lags, 95) * 1000:.0f} ms, max {lags[-1] * 1000 if lags else 0:.0f} ms "
+          "(how far the tool fell behind the requested pace)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded LingoBaby session against a test notebook.")
+    parser.add_argument("session", help="JSON-lines file written via SESSION_LOG / lingo_core.record_session")
+    parser.add_argument("--rate", type=float, help="fixed ops/second instead of recorded pacing")
+    parser.add_argument("--speed", type=float, default=1.0, help="speed-up factor for recorded pacing")
+    parser.add_argument("--repeat", type=int, default=1, help="replay the session this many times back to back")
+    parser.add_argument("--workdir", help="test notebook folder (default: fresh temp folder)")
+    args = parser.parse_args(argv)
+
+    session = os.path.abspath(args.session)
+    events = load_session(session)
+    if not events:
+        print(f"⚠️ No submit/search/explain events in {session}")
+        return 1
+
+    # Relative paths (notebook, doc, queue, lock, indexes) all land in the test folder
+    workdir = os.path.abspath(args.workdir or tempfile.mkdtemp(prefix="lingo_replay_"))
+    os.makedirs(workdir, exist_ok=True)
+    if os.path.exists(IRREGULAR_JSON):
+        shutil.copy(IRREGULAR_JSON, workdir)
+    os.chdir(workdir)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import lingo_core as core
+    core.record_session(None)   # never record the replay itself
+
+    plan = schedule(events, args.rate, args.speed, args.repeat)
+    print(f"🔁 Replaying {len(plan)} ops from {session} in {workdir}")
+    report(*run(plan, core))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
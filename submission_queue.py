@@ -0,0 +1,243 @@
+"""
+📬 Shared submission queue + single-writer lock
+-----------------------------------------------
+✅ Any front-end (GUI, bulk_ingest.py, ...) enqueues sentences as small files
+✅ Whoever holds the advisory lock file becomes the writer and applies the
+   whole backlog in one batch – one workbook save, one document save
+✅ No taskkill, no two processes rewriting the same .xlsx/.docx at once
+✅ A submission that keeps failing is set aside as <id>.failed; a notebook
+   that cannot be written (open in Office) leaves the queue for a later retry
+The lock is a file created with O_EXCL holding a random token; only the
+holder of that token releases it, and a heartbeat thread keeps it fresh.
+A lock untouched for LOCK_STALE_SECONDS was left behind by a crashed
+writer and is broken by atomically renaming it away.
+"""
+
+import itertools, json, os, threading, time, uuid
+from contextlib import contextmanager
+from config import QUEUE_DIR, LOCK_FILE, LOCK_STALE_SECONDS, QUEUE_BATCH
+
+
+# -----------------------------
+# 🔒 Advisory Lock
+# -----------------------------
+def _read_token(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().split(" ", 1)[0]
+    except OSError:
+        return None
+
+
+def _break_stale(path, stale_token):
+    """Rename a stale lock away; only one process can win the rename."""
+    grave = f"{path}.{uuid.uuid4().hex}.stale"
+    try:
+        os.rename(path, grave)
+    except OSError:
+        return  # released or broken by someone else meanwhile
+    if _read_token(grave) != stale_token:
+        # Another process broke it first and a new writer took the lock – put it back
+        try:
+            if os.name == "nt":
+                os.rename(grave, path)   # never overwrites on Windows
+                return
+            os.link(grave, path)         # fails if the name is taken
+        except OSError:
+            pass
+    else:
+        print(f"⚠️ Removed stale lock: {path}")
+    try:
+        os.remove(grave)
+    except OSError:
+        pass
+
+
+def acquire_lock(path=LOCK_FILE, timeout=0.0):
+    """Try to take the writer lock, waiting up to `timeout` seconds; return its token or None."""
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(f"{token} {os.getpid()} {time.time():.0f}")
+            return token
+        except FileExistsError:
+            stale_token = _read_token(path)
+            try:
+                stale = time.time() - os.path.getmtime(path) > LOCK_STALE_SECONDS
+            except OSError:
+                continue  # released meanwhile – retry right away
+            if stale and stale_token is not None:
+                _break_stale(path, stale_token)
+                continue
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(0.05)
+
+
+def refresh_lock(token, path=LOCK_FILE):
+    """Keep a held lock from looking stale; False if it is no longer ours."""
+    if _read_token(path) != token:
+        return False
+    try:
+        os.utime(path)
+        return True
+    except OSError:
+        return False
+
+
+def release_lock(token, path=LOCK_FILE):
+    """Remove the lock only if it still holds our token."""
+    if _read_token(path) != token:
+        print(f"⚠️ Writer lock was taken over by another process: {path}")
+        return
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+@contextmanager
+def _holding(token, path):
+    """Refresh the lock in the background while the block runs, then release it."""
+    stop = threading.Event()
+
+    def heartbeat():
+        while not stop.wait(LOCK_STALE_SECONDS / 4):
+            if not refresh_lock(token, path):
+                return
+
+    thread = threading.Thread(target=heartbeat, name="lingo-lock-heartbeat", daemon=True)
+    thread.start()
+    try:
+        yield token
+    finally:
+        stop.set()
+        thread.join()
+        release_lock(token, path)
+
+
+@contextmanager
+def writer_lock(timeout=10.0, path=LOCK_FILE):
+    """Hold the writer lock for a block; TimeoutError if another writer keeps it."""
+    token = acquire_lock(path, timeout)
+    if token is None:
+        raise TimeoutError("Another LingoBaby process is saving – try again in a moment.")
+    with _holding(token, path):
+        yield token
+
+
+# -----------------------------
+# 📨 Queue
+# -----------------------------
+_sequence = itertools.count()
+
+
+def enqueue(sentence, source="gui"):
+    """Queue one sentence; return its submission id."""
+    os.makedirs(QUEUE_DIR, exist_ok=True)
+    payload = json.dumps({"sentence": sentence, "source": source, "queued": time.time()}, ensure_ascii=False)
+    while True:
+        # time_ns() can repeat for ~15 ms on Windows – the counter keeps ids unique
+        sub_id = f"{time.time_ns():020d}-{next(_sequence):08d}-{os.getpid()}"
+        tmp = os.path.join(QUEUE_DIR, sub_id + ".tmp")
+        try:
+            fd = os.open(tmp, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            continue
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        # Publish under the final name only once complete, never over an existing file
+        try:
+            if os.name == "nt":
+                os.rename(tmp, os.path.join(QUEUE_DIR, sub_id + ".json"))   # never overwrites on Windows
+            else:
+                os.link(tmp, os.path.join(QUEUE_DIR, sub_id + ".json"))
+                os.remove(tmp)
+        except FileExistsError:
+            os.remove(tmp)
+            continue
+        return sub_id
+
+
+def pending(limit=None):
+    """Queued submission ids, oldest first."""
+    if not os.path.isdir(QUEUE_DIR):
+        return []
+    ids = sorted(name[:-5] for name in os.listdir(QUEUE_DIR) if name.endswith(".json"))
+    return ids[:limit] if limit else ids
+
+
+def _read(sub_id):
+    try:
+        with open(os.path.join(QUEUE_DIR, sub_id + ".json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️ Dropping unreadable submission {sub_id}: {e}")
+        return None
+
+
+def _set_aside(sub_id, error):
+    """Rename a submission that keeps failing to .failed so the queue moves on."""
+    print(f"⚠️ Setting aside submission {sub_id} ({error}) – see {QUEUE_DIR}/{sub_id}.failed")
+    try:
+        os.replace(os.path.join(QUEUE_DIR, sub_id + ".json"), os.path.join(QUEUE_DIR, sub_id + ".failed"))
+    except OSError:
+        pass
+
+
+def _apply(apply_batch, valid):
+    """
+    Apply a batch; if it raises (anything but OSError), retry each submission
+    alone and set aside the ones that still fail. Returns {submission id: result}.
+    An OSError (e.g. the workbook is open in Excel) propagates and leaves the
+    whole batch queued for the next attempt.
+    """
+    try:
+        outcomes = apply_batch([item["sentence"] for _, item in valid])
+        return dict(zip((sub_id for sub_id, _ in valid), outcomes))
+    except OSError:
+        raise
+    except Exception as e:
+        if len(valid) == 1:
+            _set_aside(valid[0][0], e)
+            return {valid[0][0]: e}
+    results = {}
+    for sub_id, item in valid:
+        results.update(_apply(apply_batch, [(sub_id, item)]))
+    return results
+
+
+def drain(apply_batch):
+    """
+    If no other process is writing, apply every queued submission.
+    apply_batch(sentences) must save once and return one result per sentence.
+    Returns {submission id: result}, or None when another writer holds the lock.
+    A submission that fails on its own maps to its exception and is kept as
+    <id>.failed; an OSError while saving stops the drain and is raised.
+    """
+    token = acquire_lock()
+    if token is None:
+        return None
+    results = {}
+    with _holding(token, LOCK_FILE):
+        while True:
+            ids = pending(QUEUE_BATCH)
+            if not ids:
+                break
+            batch = [(sub_id, _read(sub_id)) for sub_id in ids]
+            valid = [(sub_id, item) for sub_id, item in batch if item and item.get("sentence")]
+            if valid:
+                results.update(_apply(apply_batch, valid))
+            # Only delete after the batch is saved – a crash leaves it queued
+            for sub_id in ids:
+                try:
+                    os.remove(os.path.join(QUEUE_DIR, sub_id + ".json"))
+                except OSError:
+                    pass
+            if not refresh_lock(token):
+                print("⚠️ Writer lock lost – leaving the rest of the queue for the new writer")
+                break
+    return results
@@ -0,0 +1,52 @@
+"""
+🧪 live_preview: incremental tokenization must match a full rescan
+Run: python -m pytest -q test_live_preview.py
+"""
+
+import random
+from live_preview import PreviewAnalyzer, TOKEN_RE
+
+
+def full_tokens(text):
+    return [(m.start(), m.end(), m.group()) for m in TOKEN_RE.finditer(text)]
+
+
+def make_analyzer():
+    return PreviewAnalyzer(lambda w: w.lower(), lambda w: "", existing_words=())
+
+
+def test_typing_contractions():
+    analyzer = make_analyzer()
+    sentence = "I don't think it's fine, 'twas the students' idea"
+    for i in range(1, len(sentence) + 1):
+        analyzer._retokenize(sentence[:i])
+        assert analyzer._tokens == full_tokens(sentence[:i])
+
+
+def test_random_edits_match_full_tokenization():
+    rng = random.Random(1234)
+    alphabet = "ab't ,.-"
+    analyzer = make_analyzer()
+    text = ""
+    for _ in range(20000):
+        pos = rng.randint(0, len(text))
+        op = rng.random()
+        if op < 0.6 or not text:
+            text = text[:pos] + "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 3))) + text[pos:]
+        elif op < 0.9:
+            text = text[:pos] + text[pos + rng.randint(1, 3):]
+        else:
+            text = text[:pos] + rng.choice(alphabet) + text[pos + 1:]
+        text = text[-60:]
+        analyzer._retokenize(text)
+        assert analyzer._tokens == full_tokens(text), text
+
+
+def test_new_words_match_full_tokenization():
+    analyzer = PreviewAnalyzer(lambda w: w.lower(), lambda w: "", existing_words={"i", "think"})
+    text = ""
+    for ch in "I don't think it's fine":
+        text += ch
+        analyzer.analyze(text)
+    assert analyzer.new_words(text) == ["don't", "it's", "fine"]
+    analyzer.close()
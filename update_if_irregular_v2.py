@@ -1,20 +1,14 @@
 """
-✅ Detects irregular verbs using NLTK + heuristics
+✅ Detects irregular verbs using WordNet (compiled, see lexicon.py) + heuristics
 ✅ Skips base (1st-form) verbs
 ✅ Adds new irregulars to irregular_verbs_extended.json only if needed
 ✅ Safe for PyInstaller
 """
 
 import os, json, re
-from nltk.stem import WordNetLemmatizer
-from nltk.corpus import wordnet
-
-# Auto-download WordNet (safe for first-time users)
-import nltk
-nltk.download("wordnet", quiet=True)
+import lexicon
 
 JSON_PATH = "irregular_verbs_extended.json"
-lemmatizer = WordNetLemmatizer()
 
 
 # -----------------------------
@@ -22,7 +16,7 @@ lemmatizer = WordNetLemmatizer()
 # -----------------------------
 def lemma(word: str) -> str:
     """Return verb lemma (base form)."""
-    return lemmatizer.lemmatize(word.lower(), "v")
+    return lexicon.lemmatize_verb(word)
 
 
 def conjugate(base: str, form: str) -> str:
@@ -77,7 +71,7 @@ def detect_irregular(word: str):
     s_form = conjugate(base, "s")
 
     expected_regulars = {past, part}
-    irregular = word not in expected_regulars and wordnet.synsets(base, pos="v")
+    irregular = word not in expected_regulars and lexicon.has_synsets(base, "v")
 
     forms = {
         "base": base,
@@ -2,18 +2,20 @@
 import os
 import re
 from docx import Document
-from docx.shared import RGBColor, Pt
+from docx.shared import Pt
 from config import DOC_FILE
-from helpers import clean_word_for_compare, close_word_if_open
+from helpers import clean_word_for_compare
+from docx_renderer import add_highlighted_paragraph
 
 def init_document():
-    """Close Word if open, then load or create DOCX."""
-    close_word_if_open()
+    """Load or create DOCX (callers hold submission_queue.writer_lock, no taskkill)."""
     if os.path.exists(DOC_FILE):
         doc = Document(DOC_FILE)
     else:
         doc = Document()
         doc.add_heading("Highlighted Notes", level=1)
+    # 12pt once on the Normal style instead of on every run
+    doc.styles["Normal"].font.size = Pt(12)
     return doc
 
 def get_next_sentence_number(doc):
@@ -40,28 +42,12 @@ def append_sentence(doc, sentence_no, sentence, new_words_set):
     Append one numbered paragraph to the document. Bold + highlight the new words.
     new_words_set should contain cleaned (lowercase) words to highlight.
     """
-    p = doc.add_paragraph()
-    p.add_run(f"{sentence_no}. ")
-    for token in sentence.split():
+    def is_new(token):
         # Determine word cleaned (ignore bracketed tokens for comparison)
-        cleaned = re.sub(r"[^\w\s]", "", token)
-        cleaned_key = clean_word_for_compare(cleaned)
-        if cleaned_key and cleaned_key in new_words_set:
-            r = p.add_run(token + " ")
-            r.bold = True
-            # Word highlight via python-docx uses WD_COLOR_INDEX - but here we use run.font.highlight_color attribute not available
-            # Using a combination: bold + set font color to black (default) and rely on bold to emphasize
-            # However python-docx supports highlight by run.font.highlight_color = WD_COLOR_INDEX.YELLOW if available
-            try:
-                from docx.enum.text import WD_COLOR_INDEX
-                r.font.highlight_color = WD_COLOR_INDEX.YELLOW
-            except Exception:
-                pass
-            r.font.color.rgb = RGBColor(0, 0, 0)
-            r.font.size = Pt(12)
-        else:
-            r = p.add_run(token + " ")
-            r.font.size = Pt(12)
+        cleaned_key = clean_word_for_compare(re.sub(r"[^\w\s]", "", token))
+        return bool(cleaned_key) and cleaned_key in new_words_set
+
+    add_highlighted_paragraph(doc, sentence, is_new, prefix=f"{sentence_no}. ")
 
 def save_document(doc):
     doc.save(DOC_FILE)